@@ -316,6 +316,11 @@ class LlamaChatQt(QMainWindow):
             except:
                 pass
             
+            # Write any settings change the prompts tab is still debouncing, so the
+            # reload below sees it instead of overwriting it with the old value
+            if hasattr(self, 'prompts_tab'):
+                self.prompts_tab.flush_pending_settings()
+            
             # Reload settings from disk first to get any changes made by tabs
             self.settings = load_settings()
             
@@ -89,15 +89,11 @@ class ChatPersistenceManager:
             self.message_history.clear()
             self.message_display.clear()
             
-            # Display all messages using response manager if available
-            for msg in messages:
-                if hasattr(self.chat_tab, 'response_manager'):
-                    self.chat_tab.response_manager.display_message(
-                        msg.get("content", ""),
-                        is_user=msg.get("role") == "user",
-                        timestamp=msg.get("timestamp")
-                    )
-                self.message_history.append(msg)
+            # Display all messages using response manager if available - one bulk insert
+            # instead of one display_message() edit per message
+            if hasattr(self.chat_tab, 'response_manager'):
+                self.chat_tab.response_manager.display_history(messages)
+            self.message_history.extend(messages)
             
             if DebugConfig.chat_message_history:
                 print(f"[DEBUG] Loaded {len(messages)} messages from {self.chat_tab.current_chat_name}.json")
@@ -20,7 +20,8 @@ class QtSettingsTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_app = parent
-        self.settings = load_settings()
+        # Private copy of the settings used to populate the widgets
+        self.settings = dict(load_settings())
         
         self.create_widgets()
         self.load_settings_values()
@@ -198,8 +199,9 @@ class QtSettingsTab(QWidget):
         device_layout = QHBoxLayout()
         device_layout.addWidget(QLabel("Device (CPU/GPU):"), 0)
         self.stt_device_combo = QComboBox()
-        self.stt_device_combo.addItems(["cpu", "cuda", "mps"])
-        self.stt_device_combo.setCurrentText("cpu")
+        self.stt_device_combo.addItems(["auto", "cpu", "cuda", "mps"])
+        self.stt_device_combo.setCurrentText("auto")
+        self.stt_device_combo.setToolTip("auto = use the GPU (CUDA) when available, otherwise CPU")
         device_layout.addWidget(self.stt_device_combo, 1)
         whisper_layout.addLayout(device_layout)
         
@@ -457,7 +459,7 @@ class QtSettingsTab(QWidget):
         
         # Load Whisper settings
         self.stt_model_combo.setCurrentText(self.settings.get("stt_model", "base"))
-        self.stt_device_combo.setCurrentText(self.settings.get("stt_device", "cpu"))
+        self.stt_device_combo.setCurrentText(self.settings.get("stt_device", "auto"))
         self.stt_language_input.setText(self.settings.get("stt_language", "en"))
         self.stt_temperature_spinbox.setValue(self.settings.get("stt_temperature", 0.0))
         self.stt_rms_threshold_spinbox.setValue(self.settings.get("stt_rms_threshold", 0.03))
@@ -666,7 +668,7 @@ class QtSettingsTab(QWidget):
             print(f"[ERROR] Failed to start recording: {e}")    
     def save_all_settings(self):
         """Save all settings"""
-        settings = load_settings()
+        settings = {}
         
         # LLM settings
         settings["temperature"] = self.temp_slider.value() / 10.0
@@ -709,8 +711,16 @@ class QtSettingsTab(QWidget):
         else:
             settings["stt_input_device"] = None
         
+        # Only hand the saver the keys that differ from the current settings. Diff against the
+        # live (in-memory cached) settings, not our construction-time copy, so values other
+        # components wrote since (e.g. stt_device from the Transcribe tab) are seen
+        current = load_settings()
+        changed = {key: value for key, value in settings.items()
+                   if key not in current or current[key] != value}
+        self.settings.update(settings)
+        
         saver = get_settings_saver()
-        saver.sync_from_ui_dict(settings)
+        saver.sync_from_ui_dict(changed)
         saver.save()
         
         # Update app object attributes so they take effect immediately
@@ -5,7 +5,7 @@ Displays at bottom corner of the app
 # pylint: disable=no-name-in-module
 
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QElapsedTimer
 from PyQt5.QtGui import QFont, QColor
 from debug_config import DebugConfig
 
@@ -35,6 +35,15 @@ class QtStatusInfoPanel(QFrame):
             "llama-server": "🔴 llama-server: offline"
         }
         
+        # Token count throttling - streaming can report hundreds of updates per
+        # second, so only the latest value is shown at most every 100ms
+        self._last_token_count = None
+        self._pending_token_count = None
+        self._token_clock = QElapsedTimer()
+        self._token_timer = QTimer(self)
+        self._token_timer.setSingleShot(True)
+        self._token_timer.timeout.connect(self._flush_token_count)
+        
         # Update timer for info refresh (will be started after widgets are created)
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.refresh_display)
@@ -51,59 +60,62 @@ class QtStatusInfoPanel(QFrame):
         layout.setContentsMargins(8, 4, 8, 4)
         layout.setSpacing(15)
         
+        # One shared font for every label (avoids repeated font lookups)
+        status_font = QFont("Courier", 10, QFont.Bold)
+        
         # Connection status
         self.connection_label = QLabel("🔴 Offline")
-        self.connection_label.setFont(QFont("Courier", 10, QFont.Bold))
+        self.connection_label.setFont(status_font)
         layout.addWidget(self.connection_label)
         
         # Separator
         sep1 = QLabel("│")
-        sep1.setFont(QFont("Courier", 10, QFont.Bold))
+        sep1.setFont(status_font)
         layout.addWidget(sep1)
         
         # LLM Status
         self.llm_status_label = QLabel("⏸️ Idle")
-        self.llm_status_label.setFont(QFont("Courier", 10, QFont.Bold))
+        self.llm_status_label.setFont(status_font)
         layout.addWidget(self.llm_status_label)
         
         # Separator
         sep2 = QLabel("│")
-        sep2.setFont(QFont("Courier", 10, QFont.Bold))
+        sep2.setFont(status_font)
         layout.addWidget(sep2)
         
         # Whisper Status
         self.whisper_status_label = QLabel("🎤 Off")
-        self.whisper_status_label.setFont(QFont("Courier", 10, QFont.Bold))
+        self.whisper_status_label.setFont(status_font)
         layout.addWidget(self.whisper_status_label)
         
         # Separator
         sep3 = QLabel("│")
-        sep3.setFont(QFont("Courier", 10, QFont.Bold))
+        sep3.setFont(status_font)
         layout.addWidget(sep3)
         
         # ComfyUI Status
         self.comfyui_status_label = QLabel("🖼️ Idle")
-        self.comfyui_status_label.setFont(QFont("Courier", 10, QFont.Bold))
+        self.comfyui_status_label.setFont(status_font)
         layout.addWidget(self.comfyui_status_label)
         
         # Separator
         sep4 = QLabel("│")
-        sep4.setFont(QFont("Courier", 10, QFont.Bold))
+        sep4.setFont(status_font)
         layout.addWidget(sep4)
         
         # Tokens info
         self.tokens_label = QLabel("")
-        self.tokens_label.setFont(QFont("Courier", 10, QFont.Bold))
+        self.tokens_label.setFont(status_font)
         layout.addWidget(self.tokens_label)
         
         # Separator
         sep5 = QLabel("│")
-        sep5.setFont(QFont("Courier", 10, QFont.Bold))
+        sep5.setFont(status_font)
         layout.addWidget(sep5)
         
         # Custom info
         self.custom_info_label = QLabel("")
-        self.custom_info_label.setFont(QFont("Courier", 10, QFont.Bold))
+        self.custom_info_label.setFont(status_font)
         layout.addWidget(self.custom_info_label)
         
         # Add stretch to push everything to the left
@@ -227,6 +239,38 @@ class QtStatusInfoPanel(QFrame):
             server_type: "ollama" or "llama-server" for prefix label
         """
         if prompt_tokens is not None and generated_tokens is not None:
+            token_count = (prompt_tokens, generated_tokens, server_type)
+        else:
+            token_count = None
+        
+        # Nothing to do if the displayed value wouldn't change
+        if token_count == self._last_token_count and not self._token_timer.isActive():
+            return
+        
+        # Defer updates arriving within 100ms of the last one; the final value
+        # is shown when the single-shot timer fires
+        if self._token_clock.isValid() and self._token_clock.elapsed() < 100:
+            self._pending_token_count = token_count
+            if not self._token_timer.isActive():
+                self._token_timer.start(100 - self._token_clock.elapsed())
+            return
+        
+        self._apply_token_count(token_count)
+    
+    def _flush_token_count(self):
+        """Show the token count deferred by set_token_count"""
+        if self._pending_token_count != self._last_token_count:
+            self._apply_token_count(self._pending_token_count)
+    
+    def _apply_token_count(self, token_count):
+        """Format and display a (prompt, generated, server_type) token count"""
+        self._token_timer.stop()
+        self._last_token_count = token_count
+        self._pending_token_count = token_count
+        self._token_clock.start()
+        
+        if token_count is not None:
+            prompt_tokens, generated_tokens, server_type = token_count
             total = prompt_tokens + generated_tokens
             # Add server-specific prefix
             if server_type == "ollama":
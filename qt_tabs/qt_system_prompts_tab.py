@@ -6,13 +6,18 @@ Separate system prompts for Ollama and Llama Server
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListWidget,
-    QListWidgetItem, QTextEdit, QMessageBox, QInputDialog,
+    QListWidgetItem, QPlainTextEdit, QMessageBox, QInputDialog,
     QSplitter, QFrame, QCheckBox
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont, QTextCursor
 from pathlib import Path
+from collections import OrderedDict
+from functools import partial
+import bisect
 import os
+import shutil
+import tempfile
 from settings_manager import load_settings
 from settings_saver import get_settings_saver
 
@@ -20,6 +25,8 @@ from settings_saver import get_settings_saver
 class QtSystemPromptsTab(QWidget):
     """Manage separate system prompts for Ollama and Llama Server"""
     
+    CONTENT_CACHE_SIZE = 32
+    
     def __init__(self, app):
         super().__init__()
         self.app = app
@@ -35,6 +42,9 @@ class QtSystemPromptsTab(QWidget):
             "llama": {"path": None, "modified": False}
         }
         
+        # Small LRU cache of prompt file contents, keyed by path: (mtime_ns, size, content)
+        self._content_cache = OrderedDict()
+        
         # Checkboxes for prepending system prompt to user message
         self.ollama_prepend_checkbox = None
         self.llama_prepend_checkbox = None
@@ -43,6 +53,12 @@ class QtSystemPromptsTab(QWidget):
         self.template_list = None
         self.template_editor = None
         
+        # Coalesce bursts of settings changes (activate, prepend toggles) into one write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._flush_settings)
+        
         self.create_widgets()
         self.load_prompts()
     
@@ -50,21 +66,103 @@ class QtSystemPromptsTab(QWidget):
         """Ensure Default.txt exists with the friendly system prompt"""
         default_file = self.prompts_dir / "Default.txt"
         
-        # If Default.txt doesn't exist, create it
-        if not default_file.exists():
-            from config import SYSTEM_PROMPT
+        from config import SYSTEM_PROMPT
+        
+        # Create Default.txt only if it doesn't exist; O_EXCL makes the existence
+        # check and the create a single syscall
+        try:
+            fd = os.open(default_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return
+        except Exception as e:
+            print(f"[ERROR] Failed to create default system prompt: {e}")
+            return
+        
+        try:
+            with open(fd, 'w', encoding='utf-8') as f:
+                f.write(SYSTEM_PROMPT)
+            print(f"[DEBUG] Created default system prompt: {default_file}")
+        except Exception as e:
+            # Don't leave an empty Default.txt behind - the next start would skip creating it
             try:
-                with open(default_file, 'w', encoding='utf-8') as f:
-                    f.write(SYSTEM_PROMPT)
-                print(f"[DEBUG] Created default system prompt: {default_file}")
-            except Exception as e:
-                print(f"[ERROR] Failed to create default system prompt: {e}")
+                os.unlink(default_file)
+            except OSError:
+                pass
+            print(f"[ERROR] Failed to create default system prompt: {e}")
+    
+    def _flush_settings(self):
+        """Write settings changes queued by activate/prepend to disk"""
+        get_settings_saver().save()
+    
+    def flush_pending_settings(self):
+        """Write queued settings changes now if a save is still pending
+        
+        Called by the main window's closeEvent before it syncs its own settings copy,
+        so a prompt switch made just before closing isn't lost.
+        """
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._flush_settings()
+    
+    def _read_prompt(self, file_path):
+        """Read a prompt file, serving repeated reads from the content cache"""
+        st = os.stat(file_path)
+        content = self._cached_prompt(file_path, st)
+        if content is not None:
+            return content
+        
+        content = Path(file_path).read_text(encoding="utf-8")
+        self._cache_prompt(file_path, content, st)
+        return content
+    
+    def _cached_prompt(self, file_path, st=None):
+        """Get cached prompt content if the file hasn't changed on disk since it was cached
+        
+        Args:
+            file_path: Prompt file path
+            st: os.stat result for the file, taken here if not given
+        
+        Returns:
+            The cached content, or None if missing or stale
+        """
+        entry = self._content_cache.get(file_path)
+        if entry is None:
+            return None
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return None
+        mtime_ns, size, content = entry
+        if (st.st_mtime_ns, st.st_size) != (mtime_ns, size):
+            del self._content_cache[file_path]
+            return None
+        self._content_cache.move_to_end(file_path)
+        return content
+    
+    def _cache_prompt(self, file_path, content, st=None):
+        """Store prompt content in the cache, evicting the least recently used
+        
+        Entries carry the file's (mtime_ns, size) so edits made outside the app
+        are picked up on the next read.
+        """
+        if st is None:
+            st = os.stat(file_path)
+        self._content_cache[file_path] = (st.st_mtime_ns, st.st_size, content)
+        self._content_cache.move_to_end(file_path)
+        while len(self._content_cache) > self.CONTENT_CACHE_SIZE:
+            self._content_cache.popitem(last=False)
     
     def create_widgets(self):
         """Create system prompts manager with dual-panel layout"""
         main_layout = QVBoxLayout()
         self.setLayout(main_layout)
         
+        # Fonts shared by all labels and editors
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+        self._mono_font = QFont("Courier", 9)
+        
         # Main horizontal splitter (lists on left, editors on right)
         main_splitter = QSplitter(Qt.Horizontal)
         
@@ -76,26 +174,22 @@ class QtSystemPromptsTab(QWidget):
         
         # LEFT TOP - Ollama list
         ollama_list_label = QLabel("Ollama System Prompt")
-        ollama_font = QFont()
-        ollama_font.setBold(True)
-        ollama_list_label.setFont(ollama_font)
+        ollama_list_label.setFont(self._bold_font)
         ollama_list_label.setStyleSheet("color: #0066cc;")
         left_layout.addWidget(ollama_list_label)
         
         self.ollama_list = QListWidget()
-        self.ollama_list.itemClicked.connect(lambda item: self.on_file_select("ollama", item))
+        self.ollama_list.itemClicked.connect(partial(self.on_file_select, "ollama"))
         left_layout.addWidget(self.ollama_list)
         
         # LEFT BOTTOM - Llama list
         llama_list_label = QLabel("Llama Server System Prompt")
-        llama_font = QFont()
-        llama_font.setBold(True)
-        llama_list_label.setFont(llama_font)
+        llama_list_label.setFont(self._bold_font)
         llama_list_label.setStyleSheet("color: #cc6600;")
         left_layout.addWidget(llama_list_label)
         
         self.llama_list = QListWidget()
-        self.llama_list.itemClicked.connect(lambda item: self.on_file_select("llama", item))
+        self.llama_list.itemClicked.connect(partial(self.on_file_select, "llama"))
         left_layout.addWidget(self.llama_list)
         
         # RIGHT PANEL - Editors stacked vertically
@@ -108,119 +202,9 @@ class QtSystemPromptsTab(QWidget):
         # Create a splitter to stack the two editors vertically
         editors_splitter = QSplitter(Qt.Vertical)
         
-        # RIGHT TOP - Ollama editor in a frame
-        ollama_frame = QFrame()
-        ollama_frame_layout = QVBoxLayout()
-        ollama_frame_layout.setContentsMargins(0, 0, 0, 0)
-        ollama_frame_layout.setSpacing(2)
-        ollama_frame.setLayout(ollama_frame_layout)
-        
-        ollama_editor_label = QLabel("Ollama Content")
-        ollama_editor_font = QFont()
-        ollama_editor_font.setBold(True)
-        ollama_editor_label.setFont(ollama_editor_font)
-        ollama_editor_label.setStyleSheet("color: #0066cc;")
-        ollama_frame_layout.addWidget(ollama_editor_label)
-        
-        self.ollama_text = QTextEdit()
-        self.ollama_text.setFont(QFont("Courier", 9))
-        self.ollama_text.textChanged.connect(lambda: self.on_text_modify("ollama"))
-        ollama_frame_layout.addWidget(self.ollama_text)
-        
-        # Ollama buttons
-        ollama_button_layout = QHBoxLayout()
-        self.ollama_new_btn = QPushButton("New")
-        self.ollama_new_btn.setMaximumWidth(80)
-        self.ollama_new_btn.clicked.connect(lambda: self.create_new_prompt("ollama"))
-        ollama_button_layout.addWidget(self.ollama_new_btn)
-        
-        self.ollama_save_btn = QPushButton("Save")
-        self.ollama_save_btn.setMaximumWidth(80)
-        self.ollama_save_btn.clicked.connect(lambda: self.save_prompt("ollama"))
-        ollama_button_layout.addWidget(self.ollama_save_btn)
-        
-        self.ollama_delete_btn = QPushButton("Delete")
-        self.ollama_delete_btn.setMaximumWidth(80)
-        self.ollama_delete_btn.clicked.connect(lambda: self.delete_prompt("ollama"))
-        ollama_button_layout.addWidget(self.ollama_delete_btn)
-        
-        self.ollama_activate_btn = QPushButton("Activate")
-        self.ollama_activate_btn.setMaximumWidth(80)
-        self.ollama_activate_btn.clicked.connect(lambda: self.activate_prompt("ollama"))
-        ollama_button_layout.addWidget(self.ollama_activate_btn)
-        
-        self.ollama_add_nomic_btn = QPushButton("Add Nomic Memory")
-        self.ollama_add_nomic_btn.setMaximumWidth(160)
-        self.ollama_add_nomic_btn.clicked.connect(lambda: self.add_nomic_tracking("ollama"))
-        ollama_button_layout.addWidget(self.ollama_add_nomic_btn)
-        
-        ollama_button_layout.addStretch()
-        ollama_frame_layout.addLayout(ollama_button_layout)
-        
-        # Ollama checkbox for prepending system prompt
-        self.ollama_prepend_checkbox = QCheckBox("Prepend system prompt to user message")
-        self.ollama_prepend_checkbox.setToolTip("Workaround for Ollama models that ignore system prompts.\nEmbeds critical instructions in the user message.")
-        self.ollama_prepend_checkbox.stateChanged.connect(lambda: self.save_prepend_setting("ollama"))
-        ollama_frame_layout.addWidget(self.ollama_prepend_checkbox)
-        
-        editors_splitter.addWidget(ollama_frame)
-        
-        # RIGHT BOTTOM - Llama editor in a frame
-        llama_frame = QFrame()
-        llama_frame_layout = QVBoxLayout()
-        llama_frame_layout.setContentsMargins(0, 0, 0, 0)
-        llama_frame_layout.setSpacing(2)
-        llama_frame.setLayout(llama_frame_layout)
-        
-        llama_editor_label = QLabel("Llama Content")
-        llama_editor_font = QFont()
-        llama_editor_font.setBold(True)
-        llama_editor_label.setFont(llama_editor_font)
-        llama_editor_label.setStyleSheet("color: #cc6600;")
-        llama_frame_layout.addWidget(llama_editor_label)
-        
-        self.llama_text = QTextEdit()
-        self.llama_text.setFont(QFont("Courier", 9))
-        self.llama_text.textChanged.connect(lambda: self.on_text_modify("llama"))
-        llama_frame_layout.addWidget(self.llama_text)
-        
-        # Llama buttons
-        llama_button_layout = QHBoxLayout()
-        self.llama_new_btn = QPushButton("New")
-        self.llama_new_btn.setMaximumWidth(80)
-        self.llama_new_btn.clicked.connect(lambda: self.create_new_prompt("llama"))
-        llama_button_layout.addWidget(self.llama_new_btn)
-        
-        self.llama_save_btn = QPushButton("Save")
-        self.llama_save_btn.setMaximumWidth(80)
-        self.llama_save_btn.clicked.connect(lambda: self.save_prompt("llama"))
-        llama_button_layout.addWidget(self.llama_save_btn)
-        
-        self.llama_delete_btn = QPushButton("Delete")
-        self.llama_delete_btn.setMaximumWidth(80)
-        self.llama_delete_btn.clicked.connect(lambda: self.delete_prompt("llama"))
-        llama_button_layout.addWidget(self.llama_delete_btn)
-        
-        self.llama_activate_btn = QPushButton("Activate")
-        self.llama_activate_btn.setMaximumWidth(80)
-        self.llama_activate_btn.clicked.connect(lambda: self.activate_prompt("llama"))
-        llama_button_layout.addWidget(self.llama_activate_btn)
-        
-        self.llama_add_nomic_btn = QPushButton("Add Nomic Memory")
-        self.llama_add_nomic_btn.setMaximumWidth(160)
-        self.llama_add_nomic_btn.clicked.connect(lambda: self.add_nomic_tracking("llama"))
-        llama_button_layout.addWidget(self.llama_add_nomic_btn)
-        
-        llama_button_layout.addStretch()
-        llama_frame_layout.addLayout(llama_button_layout)
-        
-        # Llama checkbox for prepending system prompt
-        self.llama_prepend_checkbox = QCheckBox("Prepend system prompt to user message")
-        self.llama_prepend_checkbox.setToolTip("Workaround for Llama models that ignore system prompts.\nEmbeds critical instructions in the user message.")
-        self.llama_prepend_checkbox.stateChanged.connect(lambda: self.save_prepend_setting("llama"))
-        llama_frame_layout.addWidget(self.llama_prepend_checkbox)
-        
-        editors_splitter.addWidget(llama_frame)
+        # RIGHT TOP - Ollama editor, RIGHT BOTTOM - Llama editor
+        editors_splitter.addWidget(self._build_server_panel("ollama", "Ollama", "#0066cc"))
+        editors_splitter.addWidget(self._build_server_panel("llama", "Llama", "#cc6600"))
         editors_splitter.setStretchFactor(0, 1)
         editors_splitter.setStretchFactor(1, 1)
         
@@ -240,44 +224,106 @@ class QtSystemPromptsTab(QWidget):
         self.status_label.setMaximumHeight(25)
         main_layout.addWidget(self.status_label)
     
+    def _build_server_panel(self, server, title, color):
+        """Build the editor frame (editor, buttons, prepend checkbox) for one server
+        
+        Widgets are stored as self.<server>_text, self.<server>_new_btn, etc.
+        """
+        frame = QFrame()
+        frame_layout = QVBoxLayout()
+        frame_layout.setContentsMargins(0, 0, 0, 0)
+        frame_layout.setSpacing(2)
+        frame.setLayout(frame_layout)
+        
+        editor_label = QLabel(f"{title} Content")
+        editor_label.setFont(self._bold_font)
+        editor_label.setStyleSheet(f"color: {color};")
+        frame_layout.addWidget(editor_label)
+        
+        text_widget = QPlainTextEdit()
+        text_widget.setFont(self._mono_font)
+        text_widget.textChanged.connect(partial(self.on_text_modify, server))
+        frame_layout.addWidget(text_widget)
+        setattr(self, f"{server}_text", text_widget)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        buttons = [
+            ("new_btn", "New", 80, self.create_new_prompt),
+            ("save_btn", "Save", 80, self.save_prompt),
+            ("delete_btn", "Delete", 80, self.delete_prompt),
+            ("activate_btn", "Activate", 80, self.activate_prompt),
+            ("add_nomic_btn", "Add Nomic Memory", 160, self.add_nomic_tracking),
+        ]
+        for attr, text, max_width, handler in buttons:
+            button = QPushButton(text)
+            button.setMaximumWidth(max_width)
+            button.clicked.connect(partial(handler, server))
+            button_layout.addWidget(button)
+            setattr(self, f"{server}_{attr}", button)
+        
+        button_layout.addStretch()
+        frame_layout.addLayout(button_layout)
+        
+        # Checkbox for prepending system prompt
+        prepend_checkbox = QCheckBox("Prepend system prompt to user message")
+        prepend_checkbox.setToolTip(f"Workaround for {title} models that ignore system prompts.\nEmbeds critical instructions in the user message.")
+        prepend_checkbox.stateChanged.connect(partial(self.save_prepend_setting, server))
+        frame_layout.addWidget(prepend_checkbox)
+        setattr(self, f"{server}_prepend_checkbox", prepend_checkbox)
+        
+        return frame
+    
     def load_prompts(self):
         """Load all system prompts from folder for both servers"""
-        self.ollama_list.clear()
-        self.llama_list.clear()
+        # Freeze both lists while repopulating so they repaint once at the end
+        for list_widget in (self.ollama_list, self.llama_list):
+            list_widget.setUpdatesEnabled(False)
+            list_widget.blockSignals(True)
         
         try:
-            prompt_files = sorted([f for f in os.listdir(self.prompts_dir) if f.endswith('.txt')])
+            self.ollama_list.clear()
+            self.llama_list.clear()
+            
+            # Single directory pass. The cheap suffix test runs first, and is_file()
+            # answers from the readdir file type, so only symlinks cost a stat
+            with os.scandir(self.prompts_dir) as entries:
+                prompt_files = [(entry.name, entry.path) for entry in entries
+                                if entry.name.endswith('.txt') and entry.is_file()]
+            prompt_files.sort()
             
             settings = load_settings()
             saved_ollama_prompt = settings.get("selected_system_prompt_ollama", None)
             saved_llama_prompt = settings.get("selected_system_prompt_llama", None)
             
-            for filename in prompt_files:
-                # Add to both lists
-                ollama_item = QListWidgetItem(filename[:-4])
-                ollama_item.setData(Qt.UserRole, str(self.prompts_dir / filename))
+            # Rows of the saved selections, found while populating
+            ollama_sel_row = -1
+            llama_sel_row = -1
+            
+            for row, (filename, file_path) in enumerate(prompt_files):
+                if filename == saved_ollama_prompt:
+                    ollama_sel_row = row
+                if filename == saved_llama_prompt:
+                    llama_sel_row = row
+                
+                # Add to both lists (file_path is DirEntry.path, already a str)
+                name = filename[:-4]
+                ollama_item = QListWidgetItem(name)
+                ollama_item.setData(Qt.UserRole, file_path)
                 self.ollama_list.addItem(ollama_item)
                 
-                llama_item = QListWidgetItem(filename[:-4])
-                llama_item.setData(Qt.UserRole, str(self.prompts_dir / filename))
+                llama_item = QListWidgetItem(name)
+                llama_item.setData(Qt.UserRole, file_path)
                 self.llama_list.addItem(llama_item)
             
             # Restore saved selections
-            if saved_ollama_prompt:
-                for i in range(self.ollama_list.count()):
-                    item = self.ollama_list.item(i)
-                    if item.text() + ".txt" == saved_ollama_prompt:
-                        self.ollama_list.setCurrentItem(item)
-                        self.on_file_select("ollama", item)
-                        break
+            if ollama_sel_row >= 0:
+                self.ollama_list.setCurrentRow(ollama_sel_row)
+                self.on_file_select("ollama", self.ollama_list.item(ollama_sel_row))
             
-            if saved_llama_prompt:
-                for i in range(self.llama_list.count()):
-                    item = self.llama_list.item(i)
-                    if item.text() + ".txt" == saved_llama_prompt:
-                        self.llama_list.setCurrentItem(item)
-                        self.on_file_select("llama", item)
-                        break
+            if llama_sel_row >= 0:
+                self.llama_list.setCurrentRow(llama_sel_row)
+                self.on_file_select("llama", self.llama_list.item(llama_sel_row))
             
             # Load prepend settings
             ollama_prepend = settings.get("ollama_prepend_system_to_message", False)
@@ -290,6 +336,28 @@ class QtSystemPromptsTab(QWidget):
         except Exception as e:
             self.status_label.setText(f"Error loading prompts: {e}")
             print(f"[DEBUG] Error loading prompts: {e}")
+        
+        finally:
+            for list_widget in (self.ollama_list, self.llama_list):
+                list_widget.blockSignals(False)
+                list_widget.setUpdatesEnabled(True)
+    
+    def _add_prompt_item(self, filename, file_path):
+        """Insert a prompt into both lists at its sorted position"""
+        for list_widget in (self.ollama_list, self.llama_list):
+            filenames = [list_widget.item(i).text() + ".txt" for i in range(list_widget.count())]
+            row = bisect.bisect_left(filenames, filename)
+            item = QListWidgetItem(filename[:-4])
+            item.setData(Qt.UserRole, file_path)
+            list_widget.insertItem(row, item)
+    
+    def _remove_prompt_item(self, file_path):
+        """Remove a prompt from both lists"""
+        for list_widget in (self.ollama_list, self.llama_list):
+            for row in range(list_widget.count()):
+                if list_widget.item(row).data(Qt.UserRole) == file_path:
+                    list_widget.takeItem(row)
+                    break
     
     def on_file_select(self, server, item):
         """Handle file selection from listbox"""
@@ -297,7 +365,6 @@ class QtSystemPromptsTab(QWidget):
             return
         
         file_path = item.data(Qt.UserRole)
-        text_widget = self.ollama_text if server == "ollama" else self.llama_text
         
         # Check for unsaved changes
         if self.current_files[server]["modified"] and self.current_files[server]["path"]:
@@ -312,15 +379,20 @@ class QtSystemPromptsTab(QWidget):
             elif reply == QMessageBox.Cancel:
                 return
         
-        # Load the file
+        # Load the file on the next event loop pass so the click returns immediately
+        name = item.text()
+        QTimer.singleShot(0, lambda: self._load_into_editor(server, file_path, name))
+    
+    def _load_into_editor(self, server, file_path, name):
+        """Load a prompt file into the server's editor"""
+        text_widget = self.ollama_text if server == "ollama" else self.llama_text
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = self._read_prompt(file_path)
             
             text_widget.setPlainText(content)
             self.current_files[server]["path"] = file_path
             self.current_files[server]["modified"] = False
-            self.status_label.setText(f"Editing {server}: {item.text()}")
+            self.status_label.setText(f"Editing {server}: {name}")
         
         except Exception as e:
             self.status_label.setText(f"Error loading: {e}")
@@ -328,8 +400,11 @@ class QtSystemPromptsTab(QWidget):
     
     def on_text_modify(self, server):
         """Mark file as modified when text changes"""
-        if self.current_files[server]["path"]:
-            self.current_files[server]["modified"] = True
+        current = self.current_files[server]
+        if current["modified"]:
+            return  # Already flagged, nothing to do for further keystrokes
+        if current["path"]:
+            current["modified"] = True
     
     def create_new_prompt(self, server):
         """Create a new system prompt file"""
@@ -347,10 +422,10 @@ class QtSystemPromptsTab(QWidget):
                 return
             
             try:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write("")
+                file_path.write_text("", encoding="utf-8")
+                self._cache_prompt(str(file_path), "")
                 
-                self.load_prompts()
+                self._add_prompt_item(f"{name}.txt", str(file_path))
                 self.status_label.setText(f"Created: {name}")
             
             except Exception as e:
@@ -365,12 +440,34 @@ class QtSystemPromptsTab(QWidget):
         try:
             text_widget = self.ollama_text if server == "ollama" else self.llama_text
             content = text_widget.toPlainText()
+            file_path = self.current_files[server]["path"]
+            filename = os.path.basename(file_path)
             
-            with open(self.current_files[server]["path"], "w", encoding="utf-8") as f:
-                f.write(content)
+            # Nothing to write if the editor still matches what's on disk
+            if not self.current_files[server]["modified"] and self._cached_prompt(file_path) == content:
+                self.status_label.setText(f"Saved: {filename}")
+                return
+            
+            # Write to a temp file and swap it in so a crash can't leave a partial prompt.
+            # The temp file goes beside the resolved target so a symlinked prompt keeps its
+            # link (the real file is updated) and the original file mode is preserved.
+            target_path = os.path.realpath(file_path)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=os.path.dirname(target_path),
+                prefix=".prompt-", suffix=".tmp", delete=False
+            ) as tmp_file:
+                tmp_file.write(content)
+                tmp_path = tmp_file.name
+            try:
+                if os.path.exists(target_path):
+                    shutil.copymode(target_path, tmp_path)
+                os.replace(tmp_path, target_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+            self._cache_prompt(file_path, content)
             
             self.current_files[server]["modified"] = False
-            filename = os.path.basename(self.current_files[server]["path"])
             self.status_label.setText(f"Saved: {filename}")
         
         except Exception as e:
@@ -398,11 +495,12 @@ class QtSystemPromptsTab(QWidget):
         if reply == QMessageBox.Yes:
             try:
                 os.remove(file_path)
+                self._content_cache.pop(file_path, None)
                 self.current_files[server]["path"] = None
                 self.current_files[server]["modified"] = False
                 text_widget = self.ollama_text if server == "ollama" else self.llama_text
                 text_widget.clear()
-                self.load_prompts()
+                self._remove_prompt_item(file_path)
                 self.status_label.setText(f"Deleted: {prompt_name}")
             
             except Exception as e:
@@ -420,8 +518,7 @@ class QtSystemPromptsTab(QWidget):
         file_path = current.data(Qt.UserRole)
         
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = self._read_prompt(file_path)
             
             # Update app's system prompt
             if server == "ollama":
@@ -433,13 +530,13 @@ class QtSystemPromptsTab(QWidget):
                 setting_key = "system_prompt_llama"
                 selected_key = "selected_system_prompt_llama"
             
-            # Save to settings
-            settings = load_settings()
-            settings[setting_key] = content.strip()
-            settings[selected_key] = f"{current.text()}.txt"
+            # Save to settings (the saver merges these keys with the rest on save)
             saver = get_settings_saver()
-            saver.sync_from_ui_dict(settings)
-            saver.save()
+            saver.sync_from_ui_dict({
+                setting_key: content.strip(),
+                selected_key: f"{current.text()}.txt"
+            })
+            self._save_timer.start()
             
             self.status_label.setText(f"Activated {server}: {current.text()}")
         
@@ -451,10 +548,9 @@ class QtSystemPromptsTab(QWidget):
         from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QTextEdit, QPushButton, QHBoxLayout
         
         text_widget = self.ollama_text if server == "ollama" else self.llama_text
-        current_text = text_widget.toPlainText()
         
-        # Check if [nomic] already exists
-        if "[nomic]" in current_text:
+        # Check if [nomic] already exists (searches the document without copying it out)
+        if not text_widget.document().find("[nomic]").isNull():
             QMessageBox.information(
                 self, 
                 "Info", 
@@ -483,7 +579,7 @@ class QtSystemPromptsTab(QWidget):
         # Text edit for custom context
         context_edit = QTextEdit()
         context_edit.setPlaceholderText("Enter custom context here (optional)...")
-        context_edit.setFont(QFont("Courier", 9))
+        context_edit.setFont(self._mono_font)
         layout.addWidget(context_edit)
         
         # Buttons
@@ -511,8 +607,9 @@ class QtSystemPromptsTab(QWidget):
                 nomic_insertion = "\n\nCustom Context (for Nomic memory):\n[nomic]"
             
             # Add at end of prompt
-            new_text = current_text + nomic_insertion
-            text_widget.setPlainText(new_text)
+            cursor = text_widget.textCursor()
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(nomic_insertion)
             
             # Show confirmation
             QMessageBox.information(
@@ -521,24 +618,28 @@ class QtSystemPromptsTab(QWidget):
                 "Custom context and nomic tracking added to prompt"
             )
     
-    def save_prepend_setting(self, server):
-        """Save the prepend system prompt to user message setting"""
+    def save_prepend_setting(self, server, _state=None):
+        """Save the prepend system prompt to user message setting
+        
+        Args:
+            server: "ollama" or "llama"
+            _state: Checkbox state passed by stateChanged (unused, read from the checkbox)
+        """
         try:
             checkbox = self.ollama_prepend_checkbox if server == "ollama" else self.llama_prepend_checkbox
             is_checked = checkbox.isChecked()
             
-            # Save to settings
-            settings = load_settings()
+            # Save to settings (the saver merges this key with the rest on save)
             if server == "ollama":
-                settings["ollama_prepend_system_to_message"] = is_checked
+                setting_key = "ollama_prepend_system_to_message"
                 self.app.ollama_prepend_system_to_message = is_checked
             else:
-                settings["llama_prepend_system_to_message"] = is_checked
+                setting_key = "llama_prepend_system_to_message"
                 self.app.llama_prepend_system_to_message = is_checked
             
             saver = get_settings_saver()
-            saver.sync_from_ui_dict(settings)
-            saver.save()
+            saver.sync_from_ui_dict({setting_key: is_checked})
+            self._save_timer.start()
             
             status_text = "enabled" if is_checked else "disabled"
             self.status_label.setText(f"Prepend for {server} {status_text}")
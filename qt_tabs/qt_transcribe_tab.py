@@ -4,114 +4,382 @@ Converts audio to text using Whisper with language auto-detection
 """
 # pylint: disable=no-name-in-module
 
+import os
+import sys
+import json
+import wave
+import hashlib
 import threading
+import importlib.util
 import sounddevice as sd
 import soundfile as sf
+from collections import OrderedDict, deque
 from pathlib import Path
 from datetime import datetime
-import pygame
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QRadioButton,
     QButtonGroup, QComboBox, QFileDialog, QSlider, QFrame, QGroupBox,
-    QTextEdit, QMessageBox, QProgressBar, QScrollArea, QListWidget, QListWidgetItem, QLineEdit, QDoubleSpinBox
+    QTextEdit, QMessageBox, QProgressBar, QScrollArea, QListWidget, QListWidgetItem, QLineEdit, QDoubleSpinBox,
+    QCheckBox, QApplication
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QObject
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool, QUrl, QSignalBlocker
+from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+from PyQt5.QtGui import QFont, QTextCursor
 
 from debug_config import DebugConfig
 
 
-class TranscriptionWorker(QObject):
-    """Worker thread for transcription to avoid blocking UI"""
+# Loaded Whisper models shared by the transcription and detection workers,
+# keyed by (backend, model name, device, compute type). Bounded to limit RAM/VRAM use.
+_model_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_MODEL_CACHE_SIZE = 2
+
+# Result of the one-time CUDA probe used for the "auto" device
+_detected_device = None
+_cuda_capability = (0, 0)  # Compute capability of the detected GPU
+
+# Optional faster-whisper (CTranslate2) backend
+FASTER_WHISPER_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
+_FASTER_WHISPER_BATCH_SIZE = 8  # 30s windows decoded together by BatchedInferencePipeline
+
+
+def _resolve_device(device):
+    """Map "auto" (or no device) to "cuda" when a GPU is available, else "cpu"
+    
+    torch is imported lazily here, on the worker thread, the first time it's needed.
+    """
+    if device and device != "auto":
+        return device
+    _probe_cuda()
+    return _detected_device
+
+
+def _probe_cuda():
+    """Detect CUDA and the GPU's compute capability once per process"""
+    global _detected_device, _cuda_capability
+    if _detected_device is not None:
+        return
+    try:
+        import torch
+        if torch.cuda.is_available():
+            _cuda_capability = torch.cuda.get_device_capability()
+            _detected_device = "cuda"
+        else:
+            _detected_device = "cpu"
+    except (ImportError, OSError):
+        _detected_device = "cpu"
+
+
+def _compute_type(device):
+    """Pick the faster-whisper (CTranslate2) compute type for a device
+    
+    int8 weights with FP16 activations need tensor cores (compute capability 7.0+);
+    older GPUs and the CPU use plain int8.
+    """
+    if device == "cuda":
+        _probe_cuda()
+        if _cuda_capability[0] >= 7:
+            return "int8_float16"
+    return "int8"
+
+
+def _is_cuda_oom(error):
+    """Check whether an exception is a CUDA out-of-memory error"""
+    return type(error).__name__ == "OutOfMemoryError" or "CUDA out of memory" in str(error)
+
+
+def _load_model_with_fallback(model_name, device, progress, faster_whisper=False):
+    """Load a cached Whisper model, retrying on CPU if the GPU runs out of memory
+    
+    Returns:
+        tuple: (model, device actually used)
+    """
+    try:
+        return _get_whisper_model(model_name, device, faster_whisper), device
+    except Exception as e:
+        if device != "cuda" or not _is_cuda_oom(e):
+            raise
+        progress.emit("GPU out of memory - retrying on CPU...")
+        return _get_whisper_model(model_name, "cpu", faster_whisper), "cpu"
+
+
+def _get_whisper_model(model_name, device, faster_whisper=False):
+    """Load a Whisper model, reusing the cached instance when available
+    
+    Args:
+        model_name: Model size (tiny/base/small/medium/large)
+        device: "cpu" or "cuda" (already resolved, not "auto")
+        faster_whisper: Load a faster-whisper (CTranslate2, int8) model instead of openai-whisper
+    """
+    compute_type = _compute_type(device) if faster_whisper else None
+    key = ("faster-whisper" if faster_whisper else "whisper", model_name, device, compute_type)
+    with _cache_lock:
+        model = _model_cache.get(key)
+        if model is not None:
+            _model_cache.move_to_end(key)
+            return model
+        
+        if faster_whisper:
+            from faster_whisper import WhisperModel
+            model = WhisperModel(model_name, device=device, compute_type=compute_type)
+        else:
+            import whisper
+            model = whisper.load_model(model_name, device=device)
+        _model_cache[key] = model
+        while len(_model_cache) > _MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+        return model
+
+
+def _unload_models():
+    """Drop all cached Whisper models and release cached GPU memory
+    
+    Returns:
+        int: Number of models unloaded, or -1 if a model is being loaded right now
+    """
+    if not _cache_lock.acquire(blocking=False):
+        return -1  # Don't block the UI behind a model load
+    try:
+        count = len(_model_cache)
+        _model_cache.clear()
+    finally:
+        _cache_lock.release()
+    
+    import gc
+    gc.collect()
+    torch = sys.modules.get("torch")  # Only if already imported - no point loading it to free nothing
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+    return count
+
+
+def _compile_decoder(model, progress):
+    """Wrap an openai-whisper model's decoder with torch.compile (once per loaded model)
+    
+    The first decode after compiling pays the compile cost, so a 1s silent clip is
+    transcribed right away to take that hit once per session. Falls back to the
+    eager decoder if compiling fails.
+    """
+    if getattr(model, "_compiled", False):
+        return
+    import torch
+    if int(torch.__version__.split(".")[0]) < 2:
+        return  # torch.compile needs PyTorch 2.x
+    import numpy as np
+    
+    progress.emit("Compiling Whisper decoder (first run only)...")
+    eager_decoder = model.decoder
+    try:
+        model.decoder = torch.compile(eager_decoder, mode="reduce-overhead", fullgraph=False)
+        model.transcribe(np.zeros(16000, dtype=np.float32), language="en", fp16=True)
+        model._compiled = True
+    except Exception as e:
+        model.decoder = eager_decoder
+        if DebugConfig.stt_enabled:
+            print(f"[DEBUG] torch.compile failed, using eager decoder: {e}")
+
+
+def _last_active_index(samples, threshold, block_size=16000):
+    """Find the last sample whose magnitude exceeds threshold
+    
+    Scans backwards one block at a time, so only the trailing silence is read
+    and no full-length temporaries are allocated.
+    
+    Returns:
+        int: Sample index, or -1 if every sample is below threshold
+    """
+    import numpy as np
+    end = len(samples)
+    while end > 0:
+        start = max(0, end - block_size)
+        block = samples[start:end]
+        active = np.flatnonzero((block > threshold) | (block < -threshold))
+        if active.size:
+            return start + int(active[-1])
+        end = start
+    return -1
+
+# File list item kinds, stored under ITEM_KIND_ROLE
+ITEM_KIND_ROLE = Qt.UserRole + 1
+ITEM_KIND_SAVED = 0  # Recording in whisper_recordings (can be deleted)
+ITEM_KIND_CUSTOM = 1  # File loaded via "Load custom file"
+
+
+class TranscriptionSignals(QObject):
+    """Signals for TranscriptionWorker (QRunnable can't emit signals itself)"""
     finished = pyqtSignal()
     error = pyqtSignal(str)
-    result = pyqtSignal(str)
+    result = pyqtSignal(str, bool)  # text, is_final (partial results are single segments)
     progress = pyqtSignal(str)
+
+
+class TranscriptionWorker(QRunnable):
+    """Pool task for transcription to avoid blocking UI"""
     
-    def __init__(self, audio_file, language=None, device=None, model="base", temperature=0.0):
+    def __init__(self, audio_file, language=None, device=None, model="base", temperature=0.0, faster_whisper=False,
+                 audio_features=None, compile_decoder=False):
         super().__init__()
+        self.signals = TranscriptionSignals()
         self.audio_file = audio_file
         self.language = language
-        self.device = device or "cpu"  # Default to CPU if not specified
+        self.device = device or "auto"  # "auto" picks CUDA when available
         self.model = model or "base"
         self.temperature = temperature
+        self.faster_whisper = faster_whisper
+        self.audio_features = audio_features  # Encoder output from language detection, if reusable
+        self.compile_decoder = compile_decoder  # torch.compile the decoder (CUDA, openai-whisper only)
     
     def run(self):
         """Run transcription"""
         try:
-            self.progress.emit("Initializing Whisper...")
-            import whisper
+            self.signals.progress.emit("Initializing Whisper...")
             
-            self.progress.emit("Loading audio file...")
+            self.signals.progress.emit("Loading audio file...")
+            self.device = _resolve_device(self.device)
             
             # Load model on specified device
-            self.progress.emit(f"Loading Whisper model ({self.model}) on {self.device.upper()}...")
-            model = whisper.load_model(self.model, device=self.device)
+            self.signals.progress.emit(f"Loading Whisper model ({self.model}) on {self.device.upper()}...")
+            model, self.device = _load_model_with_fallback(self.model, self.device, self.signals.progress, self.faster_whisper)
+            if self.compile_decoder and self.device == "cuda" and not self.faster_whisper:
+                _compile_decoder(model, self.signals.progress)
             
             # Transcribe with specified temperature
-            self.progress.emit("Transcribing...")
+            self.signals.progress.emit("Transcribing...")
             try:
-                if self.language:
-                    result = model.transcribe(str(self.audio_file), language=self.language, temperature=self.temperature)
-                else:
-                    result = model.transcribe(str(self.audio_file), temperature=self.temperature)
+                try:
+                    result = self._transcribe(model)
+                except Exception as trans_err:
+                    if self.device != "cuda" or not _is_cuda_oom(trans_err):
+                        raise
+                    self.signals.progress.emit("GPU out of memory - retrying on CPU...")
+                    self.device = "cpu"
+                    result = self._transcribe(_get_whisper_model(self.model, self.device, self.faster_whisper))
             except Exception as trans_err:
-                self.error.emit(f"Transcription error: {str(trans_err)}\n\nTip: Try re-recording or loading a different audio file.")
+                self.signals.error.emit(f"Transcription error: {str(trans_err)}\n\nTip: Try re-recording or loading a different audio file.")
                 return
             
-            text = result.get("text", "")
-            self.result.emit(text)
-            self.progress.emit("Transcription complete!")
+            self.signals.result.emit(result, True)
+            self.signals.progress.emit("Transcription complete!")
             
         except Exception as e:
-            self.error.emit(f"Transcription error: {str(e)}")
+            self.signals.error.emit(f"Transcription error: {str(e)}")
         finally:
-            self.finished.emit()
+            self.signals.finished.emit()
+    
+    def _transcribe(self, model):
+        """Transcribe the audio file with the given model and return the text"""
+        if self.faster_whisper:
+            # Segments are decoded lazily - stream each one to the UI as it completes
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                BatchedInferencePipeline = None  # faster-whisper < 1.1
+            if BatchedInferencePipeline is not None:
+                # Decode several VAD-split windows per forward pass instead of one at a time
+                pipeline = BatchedInferencePipeline(model=model)
+                segments, _info = pipeline.transcribe(str(self.audio_file), language=self.language or None,
+                                                      temperature=self.temperature, batch_size=_FASTER_WHISPER_BATCH_SIZE)
+            else:
+                segments, _info = model.transcribe(str(self.audio_file), language=self.language or None, temperature=self.temperature)
+            texts = []
+            for segment in segments:
+                texts.append(segment.text)
+                self.signals.result.emit(segment.text, False)
+            return "".join(texts)
+        
+        fp16 = self.device == "cuda"  # Half precision on GPU; FP32 on CPU where FP16 is slower
+        features = self.audio_features
+        if features is not None and features.device == model.device and \
+                str(features.dtype) == ("torch.float16" if fp16 else "torch.float32"):
+            # Clip fits one 30s window and detection already ran the encoder on it (same device
+            # and precision): decode straight from those features instead of encoding again
+            return self._decode_features(model, features, fp16)
+        
+        if self.language:
+            result = model.transcribe(str(self.audio_file), language=self.language, temperature=self.temperature, fp16=fp16)
+        else:
+            result = model.transcribe(str(self.audio_file), temperature=self.temperature, fp16=fp16)
+        return result.get("text", "")
+    
+    def _decode_features(self, model, features, fp16):
+        """Decode one 30s window of encoder features with model.transcribe()'s safeguards
+        
+        Mirrors whisper.transcribe for a single window: retries the next temperature when the
+        output looks like a repetition loop (compression ratio) or is low-confidence (avg
+        logprob), and drops the window when it is flagged as silence (no-speech probability).
+        
+        Returns:
+            str: Transcribed text ("" for silence)
+        """
+        import whisper
+        
+        # Same defaults model.transcribe() uses
+        compression_ratio_threshold = 2.4
+        logprob_threshold = -1.0
+        no_speech_threshold = 0.6
+        temperatures = [self.temperature] if isinstance(self.temperature, (int, float)) else list(self.temperature)
+        
+        result = None
+        for temperature in temperatures:
+            options = whisper.DecodingOptions(language=self.language or None, temperature=temperature, fp16=fp16)
+            result = whisper.decode(model, features, options)[0]
+            
+            needs_fallback = (result.compression_ratio > compression_ratio_threshold
+                              or result.avg_logprob < logprob_threshold)
+            if result.no_speech_prob > no_speech_threshold:
+                needs_fallback = False  # Silence - don't retry, it gets skipped below
+            if not needs_fallback:
+                break
+        
+        # Skip the window if it's silence, unless the decode was confident anyway
+        if result.no_speech_prob > no_speech_threshold and result.avg_logprob <= logprob_threshold:
+            return ""
+        return result.text
 
 
-class LanguageDetectionWorker(QObject):
-    """Worker thread for language detection"""
+class LanguageDetectionSignals(QObject):
+    """Signals for LanguageDetectionWorker"""
     finished = pyqtSignal()
     error = pyqtSignal(str)
     result = pyqtSignal(str, str)  # language_code, language_name
     progress = pyqtSignal(str)
+
+
+class LanguageDetectionWorker(QRunnable):
+    """Pool task for language detection"""
     
-    def __init__(self, audio_file, device=None, model="base", temperature=0.0):
+    def __init__(self, audio_file, device=None, model="base", temperature=0.0, faster_whisper=False):
         super().__init__()
+        self.signals = LanguageDetectionSignals()
         self.audio_file = audio_file
-        self.device = device or "cpu"  # Default to CPU if not specified
+        self.device = device or "auto"  # "auto" picks CUDA when available
         self.model = model or "base"
         self.temperature = temperature
+        self.faster_whisper = faster_whisper
+        self.audio_features = None  # Encoder output, kept when the whole clip fits one 30s window
     
     def run(self):
         """Run language detection"""
         try:
-            self.progress.emit("Detecting language...")
-            import whisper
+            self.signals.progress.emit("Detecting language...")
             
             # Load model on specified device
-            self.progress.emit(f"Loading {self.model} model...")
-            model = whisper.load_model(self.model, device=self.device)
+            self.device = _resolve_device(self.device)
+            self.signals.progress.emit(f"Loading {self.model} model...")
+            model, self.device = _load_model_with_fallback(self.model, self.device, self.signals.progress, self.faster_whisper)
             
             # Detect language with temperature
-            self.progress.emit("Loading audio...")
-            try:
-                audio = whisper.load_audio(str(self.audio_file))
-                audio = whisper.pad_or_trim(audio)
-            except Exception as audio_err:
-                self.error.emit(f"Audio loading error: {str(audio_err)}\n\nTip: Make sure the audio file is a valid WAV/MP3. Try re-recording.")
-                return
-            
-            try:
-                mel = whisper.log_mel_spectrogram(audio).to(model.device)
-            except Exception as mel_err:
-                self.error.emit(f"Audio processing error: {str(mel_err)}\n\nTip: Try using a smaller model (tiny/base) or a different audio file.")
-                return
-            
-            # Run detection with temperature parameter
-            _, probs = model.detect_language(mel)
-            detected_language = max(probs, key=probs.get)
+            self.signals.progress.emit("Loading audio...")
+            if self.faster_whisper:
+                # transcribe() detects the language up front; segments are decoded lazily and never consumed
+                _segments, info = model.transcribe(str(self.audio_file), temperature=self.temperature)
+                detected_language = info.language
+            else:
+                detected_language = self._detect_whisper(model)
+                if detected_language is None:
+                    return
             
             # Language code to name mapping
             lang_names = {
@@ -121,25 +389,153 @@ class LanguageDetectionWorker(QObject):
             }
             language_name = lang_names.get(detected_language, detected_language.upper())
             
-            self.result.emit(detected_language, language_name)
-            self.progress.emit(f"Detected: {language_name}")
+            self.signals.result.emit(detected_language, language_name)
+            self.signals.progress.emit(f"Detected: {language_name}")
             
         except Exception as e:
-            self.error.emit(f"Language detection error: {str(e)}")
+            self.signals.error.emit(f"Language detection error: {str(e)}")
         finally:
-            self.finished.emit()
+            self.signals.finished.emit()
+    
+    def _detect_whisper(self, model):
+        """Detect the language with an openai-whisper model
+        
+        Returns:
+            str: Language code, or None after emitting an error
+        """
+        import torch
+        import whisper
+        
+        try:
+            audio = whisper.load_audio(str(self.audio_file))
+            fits_one_window = audio.shape[-1] <= whisper.audio.N_SAMPLES
+            audio = whisper.pad_or_trim(audio)
+        except Exception as audio_err:
+            self.signals.error.emit(f"Audio loading error: {str(audio_err)}\n\nTip: Make sure the audio file is a valid WAV/MP3. Try re-recording.")
+            return None
+        
+        try:
+            # Upload the raw samples and compute the mel on the model's device
+            # (STFT runs on the GPU and only the 30s of audio crosses the bus)
+            audio_t = torch.from_numpy(audio).to(model.device, non_blocking=True)
+            mel = whisper.log_mel_spectrogram(audio_t)
+            if self.device == "cuda":
+                mel = mel.half()
+        except Exception as mel_err:
+            self.signals.error.emit(f"Audio processing error: {str(mel_err)}\n\nTip: Try using a smaller model (tiny/base) or a different audio file.")
+            return None
+        
+        # Run the encoder once; detect_language skips it when handed features,
+        # and a following transcription of the same clip can decode from them too
+        with torch.no_grad():
+            features = model.embed_audio(mel.unsqueeze(0))
+        _, probs = model.detect_language(features[0])
+        if fits_one_window:
+            self.audio_features = features
+        return max(probs, key=probs.get)
+
+
+class DurationProbeSignals(QObject):
+    """Signals for DurationProbe (QRunnable can't emit signals itself)"""
+    done = pyqtSignal(str, float)  # file path, duration in seconds (-1 on error)
+
+
+class DurationProbe(QRunnable):
+    """Read an audio file's duration on a pool thread so the UI doesn't block"""
+    
+    def __init__(self, file_path, meta_cache):
+        super().__init__()
+        self.file_path = file_path
+        self.meta_cache = meta_cache  # Tab's audio metadata cache, filled in on success
+        self.signals = DurationProbeSignals()
+    
+    def run(self):
+        """Probe the file and report its duration"""
+        try:
+            # Header-only probe, no decoder state or frame reads
+            mtime_ns = os.stat(self.file_path).st_mtime_ns
+            info = sf.info(self.file_path)
+            duration = info.frames / info.samplerate
+            self.meta_cache[self.file_path] = (mtime_ns, info.frames, duration)
+            if DebugConfig.stt_enabled:
+                print(f"[DEBUG] Duration: frames={info.frames}, sr={info.samplerate}, total={duration:.2f}s")
+        except Exception as e:
+            if DebugConfig.stt_enabled:
+                print(f"[DEBUG] Error reading duration: {e}")
+                print(f"[DEBUG] File: {self.file_path}")
+            duration = -1.0
+        self.signals.done.emit(self.file_path, duration)
+
+
+class AudioConvertSignals(QObject):
+    """Signals for AudioConvertJob"""
+    done = pyqtSignal(str, str)  # source path, converted 16 kHz mono WAV path ("" on error)
+
+
+class AudioConvertJob(QRunnable):
+    """Convert a loaded audio file to a cached 16 kHz mono WAV on a pool thread
+    
+    Whisper decodes and resamples every input through ffmpeg; converting once on
+    load means detection and transcription both read a ready-made WAV.
+    """
+    
+    def __init__(self, file_path, cache_folder):
+        super().__init__()
+        self.file_path = file_path
+        self.cache_folder = cache_folder
+        self.signals = AudioConvertSignals()
+    
+    def run(self):
+        """Convert the file (or reuse an earlier conversion) and report the result"""
+        converted = ""
+        try:
+            source = Path(self.file_path)
+            try:
+                info = sf.info(self.file_path)
+                already_16k_mono = info.format == "WAV" and info.samplerate == 16000 and info.channels == 1
+            except Exception:
+                already_16k_mono = False  # Format libsndfile can't read, let ffmpeg handle it
+            
+            if already_16k_mono:
+                converted = self.file_path
+            else:
+                # Cache key covers path, mtime and size so an edited file is converted again
+                stat = source.stat()
+                key = hashlib.sha1(f"{source.resolve()}|{stat.st_mtime_ns}|{stat.st_size}".encode()).hexdigest()[:16]
+                cache_path = self.cache_folder / f"{source.stem}_{key}.wav"
+                if not cache_path.exists():
+                    import whisper
+                    audio = whisper.load_audio(self.file_path)
+                    self.cache_folder.mkdir(exist_ok=True)
+                    temp_path = cache_path.with_suffix(".tmp")
+                    sf.write(str(temp_path), audio, 16000, format="WAV")
+                    os.replace(temp_path, cache_path)
+                converted = str(cache_path)
+                if DebugConfig.stt_enabled:
+                    print(f"[DEBUG] Converted {source.name} -> {cache_path.name}")
+        except Exception as e:
+            if DebugConfig.stt_enabled:
+                print(f"[DEBUG] Audio conversion failed, using original file: {e}")
+        self.signals.done.emit(self.file_path, converted)
 
 
 class QtTranscribeTab(QWidget):
     """Transcribe Tab - Convert audio to text using Whisper"""
     
+    # Emitted from the audio callback thread when the 5-minute cap ends the stream;
+    # delivered queued on the UI thread, which stops and saves the recording
+    recording_capped = pyqtSignal()
+    
     def __init__(self, app=None):
         super().__init__()
         self.app = app
+        self.recording_capped.connect(self._on_recording_capped)
         self.audio_file = None
         self.custom_audio_file = None  # File loaded via "Load custom file"
         self.is_recording = False
-        self.recording_thread = None
+        self.input_stream = None
+        self._recorded_chunks = deque()  # Blocks appended by the input stream callback
+        self._recorded_frames = 0
         self.audio_data = None
         self.sample_rate = 16000  # 16 kHz - Whisper optimal sample rate (resamples to 16kHz anyway)
         self.detected_language_code = None
@@ -148,28 +544,65 @@ class QtTranscribeTab(QWidget):
         
         # Audio playback
         self.is_playing = False
-        self.playback_thread = None
         self.total_duration = 0  # Total duration in seconds
+        self._total_mmss = "0:00"  # total_duration formatted once per playback
+        self._last_shown_sec = -1  # Last whole second written to the time label
         self.current_position = 0  # Current playback position
         
         # Recordings folder - in project directory (not home)
         self.recordings_folder = Path.cwd() / "whisper_recordings"
         self.recordings_folder.mkdir(exist_ok=True)
+        self._file_list_cache = (0, [])  # (folder mtime_ns, newest recordings as (path, stem))
+        self._listed_paths = []  # Paths currently shown in the file list, in row order
         
-        # Initialize pygame mixer for audio playback
-        try:
-            pygame.mixer.init()
-        except Exception as e:
-            if DebugConfig.stt_enabled:
-                print(f"[DEBUG] Pygame mixer init error: {e}")
+        # Loaded files converted to 16 kHz mono WAV for Whisper: source path -> cached path
+        self.audio_cache_folder = self.recordings_folder / "_cache"
+        self._converted_audio = {}
+        
+        # Detected languages persisted per file: path -> {"code", "name", "mtime"}
+        self._lang_cache_path = self.recordings_folder / ".lang_cache.json"
+        self._lang_cache = self._load_lang_cache()
+        
+        # Audio header info: path -> (mtime_ns, frames, duration), filled by the duration probe
+        self._audio_meta_cache = {}
         
-        # Workers
+        # Qt media player for audio playback, created on first play
+        self._player = None
+        self._player_file = None  # File currently loaded into the player
+        
+        # Workers - one Whisper task at a time so detection and transcription never share the GPU
         self.transcription_worker = None
         self.detection_worker = None
-        self.transcription_thread = None
-        self.detection_thread = None
+        self._stt_pool = QThreadPool(self)
+        self._stt_pool.setMaxThreadCount(1)
+        self._stt_pending = 0  # Tasks queued or running on the STT pool
+        self._last_features = None  # {"path", "model", "features"} from the last detection
+        self._streaming_output = False  # Output cleared for segments of the running transcription
+        
+        # Background model preload, keyed by (model, device, faster_whisper)
+        self._preload_thread = None
+        self._preloaded_key = None
+        self._preload_timer = QTimer(self)
+        self._preload_timer.setSingleShot(True)
+        self._preload_timer.setInterval(300)
+        self._preload_timer.timeout.connect(self._start_preload)
+        
+        # Duration probing is debounced so arrowing through the list only probes the final file
+        self._duration_timer = QTimer(self)
+        self._duration_timer.setSingleShot(True)
+        self._duration_timer.setInterval(150)
+        self._duration_timer.timeout.connect(self._start_duration_probe)
+        
+        self._clipboard = QApplication.clipboard()
+        
+        # STT device combo on the settings tab (created before this tab), looked up once
+        self._stt_device_combo = getattr(getattr(self.app, 'settings_tab', None), 'stt_device_combo', None)
         
         self.create_widgets()
+        
+        if self._stt_device_combo is not None:
+            # A different device means a different cached model - start loading it
+            self._stt_device_combo.currentTextChanged.connect(self._maybe_preload)
     
     def create_widgets(self):
         """Create transcribe UI - Left side controls, Right side output"""
@@ -361,7 +794,10 @@ class QtTranscribeTab(QWidget):
         detect_model_layout.addWidget(QLabel("Model:"), 0)
         self.detect_model_combo = QComboBox()
         self.detect_model_combo.addItems(["tiny", "base", "small", "medium", "large"])
-        self.detect_model_combo.setCurrentText("base")
+        self.detect_model_combo.setCurrentText("tiny")  # Language ID is nearly as accurate on tiny and much faster
+        self.detect_model_combo.setToolTip("Model used only for language detection.\n"
+                                           "Defaults to tiny by design - it identifies languages reliably at a fraction of the cost.\n"
+                                           "Pick the same model as transcription to reuse its encoder pass on short clips.")
         detect_model_layout.addWidget(self.detect_model_combo, 1)
         lang_layout.addLayout(detect_model_layout)
         
@@ -427,6 +863,21 @@ class QtTranscribeTab(QWidget):
         trans_temp_layout.addWidget(QLabel("(0=deterministic, 1=random)"), 0)
         action_layout.addLayout(trans_temp_layout)
         
+        # Optional faster-whisper backend (used for detection and transcription)
+        self.faster_whisper_checkbox = QCheckBox("Use faster-whisper (int8)")
+        self.faster_whisper_checkbox.setToolTip("CTranslate2 backend with int8 quantization - faster and uses less memory.\nRequires: pip install faster-whisper")
+        self.faster_whisper_checkbox.setEnabled(FASTER_WHISPER_AVAILABLE)
+        action_layout.addWidget(self.faster_whisper_checkbox)
+        
+        self.compile_checkbox = QCheckBox("Use torch.compile (slow first run)")
+        self.compile_checkbox.setToolTip("Compile the Whisper decoder with torch.compile for faster repeated transcriptions.\n"
+                                         "Only applies to openai-whisper on CUDA with PyTorch 2.x; the first run compiles and is slow.")
+        action_layout.addWidget(self.compile_checkbox)
+        
+        # Start loading a newly chosen model while the user is still reading
+        self.trans_model_combo.currentTextChanged.connect(self._maybe_preload)
+        self.faster_whisper_checkbox.toggled.connect(self._maybe_preload)
+        
         self.transcribe_btn = QPushButton("📝 Transcribe Audio")
         self.transcribe_btn.setMinimumHeight(40)
         self.transcribe_btn.setStyleSheet("background-color: #0066cc; color: white; font-weight: bold;")
@@ -434,6 +885,11 @@ class QtTranscribeTab(QWidget):
         self.transcribe_btn.setEnabled(False)
         action_layout.addWidget(self.transcribe_btn)
         
+        unload_btn = QPushButton("🧹 Unload models")
+        unload_btn.setToolTip("Free the RAM/VRAM held by loaded Whisper models (they stay loaded between runs)")
+        unload_btn.clicked.connect(self.unload_models)
+        action_layout.addWidget(unload_btn)
+        
         # Progress bar and label for transcription
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -464,6 +920,7 @@ class QtTranscribeTab(QWidget):
         # Text output
         self.output_text = QTextEdit()
         self.output_text.setReadOnly(False)
+        self.output_text.setAcceptRichText(False)  # Transcripts are plain text
         self.output_text.setPlaceholderText("Transcribed text will appear here...")
         right_layout.addWidget(self.output_text, 1)
         
@@ -494,6 +951,31 @@ class QtTranscribeTab(QWidget):
         # Initialize
         self.populate_input_devices()
         self.refresh_file_list()
+        
+        # Import whisper/torch in the background so the first transcription doesn't pay for it
+        QTimer.singleShot(0, self._warm_whisper)
+    
+    def _warm_whisper(self):
+        """Import the Whisper stack on a daemon thread"""
+        def warm():
+            try:
+                import torch  # noqa: F401
+                import whisper  # noqa: F401
+            except Exception as e:
+                if DebugConfig.stt_enabled:
+                    print(f"[DEBUG] Whisper warm-up import failed: {e}")
+        
+        threading.Thread(target=warm, daemon=True).start()
+    
+    def _ensure_player(self):
+        """Create the media player on first use"""
+        if self._player is None:
+            self._player = QMediaPlayer(self)
+            # Position updates arrive as signals on the GUI thread; 100ms keeps the seekbar smooth
+            self._player.setNotifyInterval(100)
+            self._player.positionChanged.connect(self._on_playback_position)
+            self._player.stateChanged.connect(self._on_playback_state)
+        return self._player
     
     def populate_input_devices(self):
         """Populate available input devices"""
@@ -533,43 +1015,63 @@ class QtTranscribeTab(QWidget):
         
         device_idx = self.device_combo.currentData()
         
-        self.recording_thread = threading.Thread(
-            target=self._record_audio,
-            args=(device_idx,),
-            daemon=True
-        )
-        self.recording_thread.start()
-    
-    def _record_audio(self, device_idx):
-        """Record audio in background thread"""
+        # Stream into a list of blocks instead of pre-allocating the full 5 minutes
+        self.audio_data = None
+        self._recorded_chunks = deque()
+        self._recorded_frames = 0
         try:
-            duration = 300  # Max 5 minutes
-            self.audio_data = sd.rec(
-                int(self.sample_rate * duration),
+            self.input_stream = sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=1,
+                dtype="float32",
                 device=device_idx,
-                blocking=True
+                blocksize=4096,
+                callback=self._on_audio_block
             )
-            if DebugConfig.stt_enabled:
-                actual_duration = len(self.audio_data) / self.sample_rate
-                print(f"[DEBUG] Recorded {actual_duration:.2f} seconds")
+            self.input_stream.start()
         except Exception as e:
             if DebugConfig.stt_enabled:
                 print(f"[DEBUG] Recording error: {e}")
+            self.input_stream = None
+            self.is_recording = False
+            self.record_btn.setEnabled(True)
+            self.stop_btn.setEnabled(False)
+            self.record_status.setText(f"✗ Error: {str(e)[:30]}")
+            self.record_status.setStyleSheet("color: #880000;")
+    
+    def _on_audio_block(self, indata, frames, time_info, status):
+        """sounddevice callback - collect one block of recorded audio"""
+        self._recorded_chunks.append(indata.copy())
+        self._recorded_frames += frames
+        if self._recorded_frames >= self.sample_rate * 300:  # Max 5 minutes
+            self.recording_capped.emit()
+            raise sd.CallbackStop()
+    
+    def _on_recording_capped(self):
+        """The input stream hit the length cap - finish the recording as if Stop was pressed"""
+        if self.is_recording:
+            self.stop_recording()
     
     def stop_recording(self):
         """Stop recording audio"""
         try:
             self.is_recording = False
-            sd.stop()  # Actually stop the recording
-            
-            # Wait for thread to finish with timeout
-            if self.recording_thread and self.recording_thread.is_alive():
-                self.recording_thread.join(timeout=2)
+            if self.input_stream is not None:
+                self.input_stream.stop()
+                self.input_stream.close()
         except Exception as e:
             if DebugConfig.stt_enabled:
                 print(f"[DEBUG] Error stopping recording: {e}")
+        finally:
+            self.input_stream = None
+        
+        if self._recorded_chunks:
+            import numpy as np
+            self.audio_data = np.concatenate(self._recorded_chunks, axis=0)
+            self._recorded_chunks = deque()
+            if DebugConfig.stt_enabled:
+                actual_duration = len(self.audio_data) / self.sample_rate
+                print(f"[DEBUG] Recorded {actual_duration:.2f} seconds")
         
         self.record_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
@@ -581,35 +1083,36 @@ class QtTranscribeTab(QWidget):
             if self.audio_data is not None:
                 import numpy as np
                 
-                # Apply microphone gain amplification
-                audio_to_save = self.audio_data * self.microphone_gain
+                # Apply microphone gain amplification (in place, the buffer isn't reused)
+                audio_to_save = self.audio_data
+                if self.microphone_gain != 1.0:
+                    np.multiply(audio_to_save, self.microphone_gain, out=audio_to_save)
                 
                 # Find actual recording length (where signal drops below threshold)
-                audio_array = np.abs(audio_to_save.flatten())
-                # Find last sample with significant energy (threshold: 1% of max)
-                max_level = np.max(audio_array)
+                samples = audio_to_save.reshape(-1)
+                # Find last sample with significant energy (threshold: 1% of peak)
+                max_level = max(samples.max(), -samples.min())  # Peak |x| without an abs() copy
                 if max_level > 0:
                     threshold = max_level * 0.01
-                    active_indices = np.where(audio_array > threshold)[0]
-                    if len(active_indices) > 0:
-                        # Trim to last active sample with small buffer
-                        trim_idx = min(active_indices[-1] + 8820, len(audio_to_save))  # 8820 = 0.2s buffer at 44.1kHz
-                        trimmed_audio = audio_to_save[:trim_idx]
-                    else:
-                        trimmed_audio = audio_to_save
+                    last_active = _last_active_index(samples, threshold)
+                    # Trim to last active sample with small buffer
+                    trim_idx = min(last_active + int(self.sample_rate * 0.2), len(audio_to_save))  # 0.2s buffer
+                    trimmed_audio = audio_to_save[:trim_idx]
                 else:
                     trimmed_audio = audio_to_save
                 
                 # Name format: 20260102_143022_transcribe.wav
                 filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_transcribe.wav"
                 temp_path = self.recordings_folder / filename
-                sf.write(str(temp_path), trimmed_audio, self.sample_rate)
+                # Gain can push peaks past full scale; clip in place so the 16-bit
+                # conversion saturates instead of wrapping around
+                np.clip(trimmed_audio, -1.0, 1.0, out=trimmed_audio)
+                sf.write(str(temp_path), trimmed_audio, self.sample_rate, subtype="PCM_16", format="WAV")
                 
                 # Verify file was written
                 if temp_path.exists():
                     self.audio_file = temp_path
-                    self.transcribe_btn.setEnabled(True)
-                    self.detect_btn.setEnabled(True)
+                    self._update_action_buttons()
                     self.update_duration_label()
                     self.refresh_file_list()
                     # Auto-select the new recording
@@ -638,69 +1141,188 @@ class QtTranscribeTab(QWidget):
         if file_path:
             self.custom_audio_file = Path(file_path)
             self.audio_file = self.custom_audio_file
-            self.transcribe_btn.setEnabled(True)
-            self.detect_btn.setEnabled(True)
+            self._start_conversion(self.custom_audio_file)
+            self._update_action_buttons()
             self.update_duration_label()
+            self._maybe_preload()
             self.refresh_file_list()
             self.select_file_by_path(self.audio_file)
     
+    def _stt_device(self):
+        """Get the STT device from settings ("auto" picks the GPU if available)"""
+        return self._stt_device_combo.currentText() if self._stt_device_combo is not None else "auto"
+    
+    def _maybe_preload(self):
+        """Schedule a background load of the selected transcription model
+        
+        Changes are debounced so flicking through models, devices or the backend
+        only preloads the final selection.
+        """
+        if self.audio_file:
+            self._preload_timer.start()
+    
+    def _preload_selection(self):
+        """Get the (model, device, faster_whisper) key of the current selection"""
+        return (
+            self.trans_model_combo.currentText(),
+            self._stt_device(),
+            self.faster_whisper_checkbox.isChecked(),
+        )
+    
+    def _start_preload(self):
+        """Load the selected model on a daemon thread
+        
+        The worker then finds the model in the cache (or waits on the cache lock
+        if the preload is still running) instead of loading it from scratch.
+        """
+        if not self.audio_file:
+            return
+        key = self._preload_selection()
+        if key == self._preloaded_key:
+            return
+        if self._preload_thread is not None and self._preload_thread.is_alive():
+            # One preload at a time - check again once the running one has had time to finish
+            self._preload_timer.start()
+            return
+        self._preloaded_key = key
+        model_name, device, faster_whisper = key
+        
+        def preload():
+            # The selection may have moved on while the thread was starting
+            if self._preloaded_key != key:
+                return
+            try:
+                _get_whisper_model(model_name, _resolve_device(device), faster_whisper)
+            except Exception as e:
+                if DebugConfig.stt_enabled:
+                    print(f"[DEBUG] Model preload failed: {e}")
+        
+        self._preload_thread = threading.Thread(target=preload, daemon=True)
+        self._preload_thread.start()
+    
+    def _start_conversion(self, file_path):
+        """Convert a loaded file to 16 kHz mono WAV in the background (once per file)"""
+        if str(file_path) in self._converted_audio:
+            return
+        job = AudioConvertJob(str(file_path), self.audio_cache_folder)
+        job.signals.done.connect(self._on_conversion_done)
+        QThreadPool.globalInstance().start(job)
+    
+    def _on_conversion_done(self, file_path, converted):
+        """Remember the converted copy so the workers read it instead of the original"""
+        if converted:
+            self._converted_audio[file_path] = converted
+    
+    def _whisper_input_file(self):
+        """Get the file to hand to Whisper - the converted copy once it's ready"""
+        converted = self._converted_audio.get(str(self.audio_file))
+        if converted and Path(converted).exists():
+            return Path(converted)
+        return self.audio_file
+    
     def update_duration_label(self):
-        """Update duration label using soundfile"""
+        """Update duration label (the file is probed in the background)"""
         if not self.audio_file or not self.audio_file.exists():
+            self._duration_timer.stop()
             self.duration_label.setText("Duration: --")
             self.total_duration = 0
             self.time_label.setText("0:00 / 0:00")
             return
         
-        try:
-            import soundfile as sf
-            # Read audio file info
-            with sf.SoundFile(str(self.audio_file)) as f:
-                frames = f.frames
-                sr = f.samplerate
-                self.total_duration = frames / sr
-                
-                if DebugConfig.stt_enabled:
-                    print(f"[DEBUG] Duration: frames={frames}, sr={sr}, total={self.total_duration:.2f}s")
-            
-            minutes, seconds = int(self.total_duration // 60), int(self.total_duration % 60)
-            self.duration_label.setText(f"Duration: {minutes}:{seconds:02d}")
-            self.time_label.setText(f"0:00 / {minutes}:{seconds:02d}")
-            self.seekbar.setRange(0, int(self.total_duration * 1000))  # milliseconds
-        except Exception as e:
-            if DebugConfig.stt_enabled:
-                print(f"[DEBUG] Error reading duration: {e}")
-                print(f"[DEBUG] File: {self.audio_file}")
+        self._duration_timer.start()
+    
+    def _start_duration_probe(self):
+        """Probe the current audio file's duration on the global thread pool"""
+        if not self.audio_file:
+            return
+        probe = DurationProbe(str(self.audio_file), self._audio_meta_cache)
+        probe.signals.done.connect(self._on_duration_ready)
+        QThreadPool.globalInstance().start(probe)
+    
+    def _on_duration_ready(self, file_path, duration):
+        """Show the probed duration if it's still for the current file"""
+        if not self.audio_file or file_path != str(self.audio_file):
+            return  # Selection changed while probing
+        
+        if duration < 0:
             self.duration_label.setText("Duration: --")
             self.total_duration = 0
             self.time_label.setText("0:00 / 0:00")
+            return
+        
+        self.total_duration = duration
+        minutes, seconds = int(self.total_duration // 60), int(self.total_duration % 60)
+        self.duration_label.setText(f"Duration: {minutes}:{seconds:02d}")
+        self.time_label.setText(f"0:00 / {minutes}:{seconds:02d}")
+        self.seekbar.setRange(0, int(self.total_duration * 1000))  # milliseconds
     
     def refresh_file_list(self):
-        """Refresh the file list with custom file first, then saved recordings (newest first, max 5)"""
-        self.file_list.clear()
+        """Refresh the file list with custom file first, then saved recordings (newest first, max 5)
         
+        Only the rows that changed are inserted or removed, so saving a recording
+        doesn't rebuild the whole list.
+        """
         try:
+            entries = []  # (path, label, kind) in display order
+            
             # Add custom file first if selected
             if self.custom_audio_file and self.custom_audio_file.exists():
-                item = QListWidgetItem(f"📁 custom: {self.custom_audio_file.name}")
-                item.setData(Qt.UserRole, str(self.custom_audio_file))
-                self.file_list.addItem(item)
+                entries.append((str(self.custom_audio_file), f"📁 custom: {self.custom_audio_file.name}", ITEM_KIND_CUSTOM))
             
-            # Get all .wav files from recordings folder, sorted by date (newest first)
-            wav_files = sorted(
-                self.recordings_folder.glob("*.wav"),
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )[:5]  # Only show 5 most recent
+            # Folder mtime changes whenever a recording is added, removed or renamed,
+            # so only re-scan when it moves
+            folder_mtime = self.recordings_folder.stat().st_mtime_ns
+            cached_mtime, recordings = self._file_list_cache
+            if folder_mtime != cached_mtime:
+                wav_files = []
+                with os.scandir(self.recordings_folder) as dir_entries:
+                    for entry in dir_entries:
+                        if entry.name.endswith(".wav") and entry.is_file():
+                            wav_files.append((entry.stat().st_mtime, entry.path, entry.name[:-4]))
+                # Sorted by date (newest first), only show 5 most recent
+                wav_files.sort(reverse=True)
+                recordings = [(path, stem) for _, path, stem in wav_files[:5]]
+                self._file_list_cache = (folder_mtime, recordings)
             
-            for file_path in wav_files:
-                item = QListWidgetItem(f"🎙️ {file_path.stem}")
-                item.setData(Qt.UserRole, str(file_path))
-                self.file_list.addItem(item)
+            entries.extend((file_path, f"🎙️ {stem}", ITEM_KIND_SAVED) for file_path, stem in recordings)
+            self._update_file_list(entries)
         except Exception as e:
             if DebugConfig.stt_enabled:
                 print(f"[DEBUG] Error refreshing file list: {e}")
     
+    def _update_file_list(self, entries):
+        """Apply the difference between the listed rows and entries to the file list"""
+        new_paths = [path for path, _, _ in entries]
+        if new_paths == self._listed_paths:
+            return
+        
+        wanted = set(new_paths)
+        self.file_list.blockSignals(True)  # Rows shifting shouldn't trigger on_file_selected
+        try:
+            # Drop rows that are no longer listed
+            for row in range(self.file_list.count() - 1, -1, -1):
+                if self.file_list.item(row).data(Qt.UserRole) not in wanted:
+                    self.file_list.takeItem(row)
+            
+            # Insert new rows (and move any retained row that's out of place)
+            for row, (path, label, kind) in enumerate(entries):
+                current = self.file_list.item(row)
+                if current is not None and current.data(Qt.UserRole) == path:
+                    continue
+                item = None
+                for later in range(row + 1, self.file_list.count()):
+                    if self.file_list.item(later).data(Qt.UserRole) == path:
+                        item = self.file_list.takeItem(later)
+                        break
+                if item is None:
+                    item = QListWidgetItem(label)
+                    item.setData(Qt.UserRole, path)
+                    item.setData(ITEM_KIND_ROLE, kind)
+                self.file_list.insertItem(row, item)
+        finally:
+            self.file_list.blockSignals(False)
+        self._listed_paths = new_paths
+    
     def on_file_selected(self):
         """Handle file selection from list"""
         current_item = self.file_list.currentItem()
@@ -708,9 +1330,9 @@ class QtTranscribeTab(QWidget):
             file_path = Path(current_item.data(Qt.UserRole))
             if file_path.exists():
                 self.audio_file = file_path
-                self.transcribe_btn.setEnabled(True)
-                self.detect_btn.setEnabled(True)
+                self._update_action_buttons()
                 self.update_duration_label()
+                self._maybe_preload()
     
     def select_file_by_path(self, file_path):
         """Select a file in the list by its path"""
@@ -727,14 +1349,18 @@ class QtTranscribeTab(QWidget):
             QMessageBox.warning(self, "Warning", "Please select a file to delete")
             return
         
-        file_text = current_item.text()
         file_path = Path(current_item.data(Qt.UserRole))
         
         # Don't allow deletion of custom loaded files
-        if file_text.startswith("📁 custom:"):
+        if current_item.data(ITEM_KIND_ROLE) == ITEM_KIND_CUSTOM:
             QMessageBox.warning(self, "Warning", "Cannot delete custom loaded files. Only saved recordings can be deleted.")
             return
         
+        # Already gone (deleted outside the app) - just drop it from the list
+        if not os.path.isfile(file_path):
+            self.refresh_file_list()
+            return
+        
         # Ask for confirmation
         reply = QMessageBox.question(
             self,
@@ -745,21 +1371,19 @@ class QtTranscribeTab(QWidget):
         
         if reply == QMessageBox.Yes:
             try:
-                # Stop playback and release the file if it's currently playing
-                if self.is_playing:
-                    self.is_playing = False
-                    pygame.mixer.music.stop()
-                
-                # Close mixer to release file lock
-                pygame.mixer.music.unload()
+                if self._player is not None and self._player_file == file_path:
+                    # Stop playback and clear the media to release the file lock
+                    # (playback of any other file carries on)
+                    self._player.stop()
+                    self._player.setMedia(QMediaContent())
+                    self._player_file = None
                 
-                file_path.unlink()  # Delete the file
+                file_path.unlink(missing_ok=True)  # Delete the file
                 
                 # If this was the current audio file, clear it
                 if self.audio_file == file_path:
                     self.audio_file = None
-                    self.transcribe_btn.setEnabled(False)
-                    self.detect_btn.setEnabled(False)
+                    self._update_action_buttons()
                     self.duration_label.setText("Duration: --")
                     self.time_label.setText("0:00 / 0:00")
                 
@@ -771,41 +1395,117 @@ class QtTranscribeTab(QWidget):
                     print(f"[DEBUG] Error deleting file: {e}")
                 QMessageBox.critical(self, "Error", f"Failed to delete file: {str(e)}")
     
+    def _get_audio_frames(self, file_path):
+        """Get an audio file's frame count, using the cached header info when the file is unchanged
+        
+        Raises:
+            Exception: If soundfile can't read the file
+        """
+        stat = os.stat(file_path)
+        if stat.st_size < 44:
+            return 0  # Smaller than a WAV header - nothing to decode
+        key = str(file_path)
+        cached = self._audio_meta_cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns:
+            return cached[1]
+        frames, sample_rate = None, None
+        if key.lower().endswith(".wav"):
+            # PCM WAV header via the stdlib; float/extensible WAVs fall through to soundfile
+            try:
+                with wave.open(key, "rb") as wav:
+                    frames, sample_rate = wav.getnframes(), wav.getframerate()
+            except (wave.Error, EOFError):
+                pass
+        if frames is None:
+            info = sf.info(key)
+            frames, sample_rate = info.frames, info.samplerate
+        self._audio_meta_cache[key] = (stat.st_mtime_ns, frames, frames / sample_rate if sample_rate else 0.0)
+        return frames
+    
+    def _load_lang_cache(self):
+        """Load the detected-language cache from disk, dropping entries for deleted files"""
+        try:
+            with open(self._lang_cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            return {path: entry for path, entry in cache.items() if os.path.exists(path)}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            if DebugConfig.stt_enabled:
+                print(f"[DEBUG] Ignoring unreadable language cache: {e}")
+            return {}
+    
+    def _save_lang_cache(self):
+        """Write the detected-language cache atomically (temp file + replace)"""
+        temp_path = self._lang_cache_path.with_suffix(".tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self._lang_cache, f, indent=2)
+            os.replace(temp_path, self._lang_cache_path)
+        except Exception as e:
+            if DebugConfig.stt_enabled:
+                print(f"[DEBUG] Error saving language cache: {e}")
+    
     def detect_language(self):
         """Auto-detect language from audio"""
         if not self.audio_file or not self.audio_file.exists():
             QMessageBox.warning(self, "Warning", "Please record or load an audio file first")
             return
         
+        # Get detection model and temperature from UI
+        detect_model = self.detect_model_combo.currentText()
+        detect_temp = self.detect_temp_spinbox.value()
+        faster_whisper = self.faster_whisper_checkbox.isChecked()
+        
+        # Reuse an earlier detection if the file hasn't changed since and the same model and backend made it
+        input_file = self._whisper_input_file()
+        cached = self._lang_cache.get(str(input_file))
+        if (cached and cached.get("mtime") == input_file.stat().st_mtime
+                and cached.get("model") == detect_model and cached.get("faster_whisper") == faster_whisper):
+            self.on_language_detected(cached["code"], cached["name"])
+            return
+        
         # Check if audio file has content
         try:
-            import soundfile as sf
-            with sf.SoundFile(str(self.audio_file)) as f:
-                if f.frames == 0:
-                    QMessageBox.warning(self, "Warning", "Audio file is empty. Please record some audio or load a valid audio file.")
-                    return
+            if self._get_audio_frames(self.audio_file) == 0:
+                QMessageBox.warning(self, "Warning", "Audio file is empty. Please record some audio or load a valid audio file.")
+                return
         except Exception as e:
             QMessageBox.warning(self, "Warning", f"Cannot read audio file: {str(e)}\n\nMake sure it's a valid WAV, MP3, or other audio format.")
             return
         
         self.detect_progress_label.setText("Detecting language...")
         
-        # Get device from settings
-        device = "cpu"  # Default to CPU
-        if self.app and hasattr(self.app, 'settings_tab') and hasattr(self.app.settings_tab, 'stt_device_combo'):
-            device = self.app.settings_tab.stt_device_combo.currentText()
+        device = self._stt_device()
         
-        # Get detection model and temperature from UI
-        detect_model = self.detect_model_combo.currentText()
-        detect_temp = self.detect_temp_spinbox.value()
+        self.detection_worker = LanguageDetectionWorker(input_file, device=device, model=detect_model, temperature=detect_temp,
+                                                        faster_whisper=faster_whisper)
+        worker = self.detection_worker
+        worker.signals.result.connect(lambda code, name: self._on_detection_result(worker, code, name))
+        worker.signals.error.connect(self.on_detection_error)
+        worker.signals.progress.connect(lambda msg: self.detect_progress_label.setText(msg))
         
-        self.detection_worker = LanguageDetectionWorker(self.audio_file, device=device, model=detect_model, temperature=detect_temp)
-        self.detection_worker.result.connect(self.on_language_detected)
-        self.detection_worker.error.connect(self.on_detection_error)
-        self.detection_worker.progress.connect(lambda msg: self.detect_progress_label.setText(msg))
+        self._start_stt_task(worker)
+    
+    def _on_detection_result(self, worker, lang_code, lang_name):
+        """Remember a fresh detection result (language cache, encoder features), then show it"""
+        file_path = Path(worker.audio_file)
+        try:
+            self._lang_cache[str(file_path)] = {"code": lang_code, "name": lang_name, "mtime": file_path.stat().st_mtime,
+                                                "model": worker.model, "faster_whisper": worker.faster_whisper}
+            self._save_lang_cache()
+        except OSError:
+            pass  # File removed meanwhile
+        
+        if worker.audio_features is not None:
+            # Device and dtype are part of the key - decode needs features matching the model's
+            # device and fp16 setting (detection may have fallen back to CPU after an OOM)
+            self._last_features = {"path": str(worker.audio_file), "model": worker.model, "device": worker.device,
+                                   "dtype": str(worker.audio_features.dtype), "features": worker.audio_features}
+        else:
+            self._last_features = None
         
-        self.detection_thread = threading.Thread(target=self.detection_worker.run, daemon=True)
-        self.detection_thread.start()
+        self.on_language_detected(lang_code, lang_name)
     
     def on_language_detected(self, lang_code, lang_name):
         """Handle detected language"""
@@ -832,11 +1532,9 @@ class QtTranscribeTab(QWidget):
         
         # Check if audio file has content
         try:
-            import soundfile as sf
-            with sf.SoundFile(str(self.audio_file)) as f:
-                if f.frames == 0:
-                    QMessageBox.warning(self, "Warning", "Audio file is empty. Please record some audio or load a valid audio file.")
-                    return
+            if self._get_audio_frames(self.audio_file) == 0:
+                QMessageBox.warning(self, "Warning", "Audio file is empty. Please record some audio or load a valid audio file.")
+                return
         except Exception as e:
             QMessageBox.warning(self, "Warning", f"Cannot read audio file: {str(e)}\n\nMake sure it's a valid WAV, MP3, or other audio format.")
             return
@@ -845,44 +1543,91 @@ class QtTranscribeTab(QWidget):
         language_text = self.language_input.text().strip()
         language = language_text if language_text else None
         
-        self.transcribe_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.progress_label.setText("Starting transcription...")
         
-        # Get device from settings
-        device = "cpu"  # Default to CPU
-        if self.app and hasattr(self.app, 'settings_tab') and hasattr(self.app.settings_tab, 'stt_device_combo'):
-            device = self.app.settings_tab.stt_device_combo.currentText()
+        device = self._stt_device()
         
         # Get transcription model and temperature from UI
         trans_model = self.trans_model_combo.currentText()
         trans_temp = self.trans_temp_spinbox.value()
-        
-        self.transcription_worker = TranscriptionWorker(self.audio_file, language, device=device, model=trans_model, temperature=trans_temp)
-        self.transcription_worker.result.connect(self.on_transcription_complete)
-        self.transcription_worker.error.connect(self.on_transcription_error)
-        self.transcription_worker.progress.connect(lambda msg: self.progress_label.setText(msg))
-        
-        self.transcription_thread = threading.Thread(target=self.transcription_worker.run, daemon=True)
-        self.transcription_thread.start()
+        faster_whisper = self.faster_whisper_checkbox.isChecked()
+        input_file = self._whisper_input_file()
+        
+        # Reuse the encoder output from detection when it was run on this clip with this model,
+        # on the same device and at the precision transcription will use there
+        audio_features = None
+        cached = self._last_features
+        if cached and not faster_whisper and cached["path"] == str(input_file) and cached["model"] == trans_model:
+            resolved = _resolve_device(device)
+            if cached["device"] == resolved and cached["dtype"] == ("torch.float16" if resolved == "cuda" else "torch.float32"):
+                audio_features = cached["features"]
+        
+        self.transcription_worker = TranscriptionWorker(input_file, language, device=device, model=trans_model, temperature=trans_temp,
+                                                        faster_whisper=faster_whisper, audio_features=audio_features,
+                                                        compile_decoder=self.compile_checkbox.isChecked())
+        self._streaming_output = False
+        self.transcription_worker.signals.result.connect(self.on_transcription_complete)
+        self.transcription_worker.signals.error.connect(self.on_transcription_error)
+        self.transcription_worker.signals.progress.connect(lambda msg: self.progress_label.setText(msg))
+        
+        self._start_stt_task(self.transcription_worker)
+    
+    def _start_stt_task(self, worker):
+        """Queue a Whisper task on the single-thread STT pool, with Detect/Transcribe disabled until it's done"""
+        self._stt_pending += 1
+        worker.signals.finished.connect(self._on_stt_task_finished)
+        self._update_action_buttons()
+        self._stt_pool.start(worker)
+    
+    def _on_stt_task_finished(self):
+        """Re-enable Detect/Transcribe once the STT pool is idle"""
+        self._stt_pending -= 1
+        self._update_action_buttons()
+    
+    def _update_action_buttons(self):
+        """Enable Detect/Transcribe when there's a file and no Whisper task pending"""
+        enabled = self.audio_file is not None and self._stt_pending == 0
+        self.transcribe_btn.setEnabled(enabled)
+        self.detect_btn.setEnabled(enabled)
     
-    def on_transcription_complete(self, text):
-        """Handle transcription completion"""
-        self.output_text.setText(text)
+    def unload_models(self):
+        """Unload cached Whisper models to free memory"""
+        count = _unload_models()
+        if count < 0:
+            self.progress_label.setText("A model is loading - try again when it finishes")
+            return
+        self._last_features = None  # Tensors belong to the unloaded models
+        self._preloaded_key = None
+        self.progress_label.setText(f"Unloaded {count} model(s)")
+    
+    def on_transcription_complete(self, text, is_final=True):
+        """Handle a streamed segment, or the full text once transcription completes"""
+        if not is_final:
+            # The previous transcript stays visible until the first new segment arrives
+            if not self._streaming_output:
+                self._streaming_output = True
+                self.output_text.clear()
+            cursor = self.output_text.textCursor()
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text)
+            return
+        
+        # Final text replaces the streamed segments (also covers a CPU retry after GPU OOM)
+        self._streaming_output = False
+        self.output_text.setPlainText(text)  # No HTML parse (and no markup misread in transcripts)
         self.progress_bar.setVisible(False)
         self.progress_label.setText("✓ Transcription complete!")
-        self.transcribe_btn.setEnabled(True)
     
     def on_transcription_error(self, error_msg):
         """Handle transcription error"""
         QMessageBox.critical(self, "Transcription Error", error_msg)
         self.progress_bar.setVisible(False)
         self.progress_label.setText("")
-        self.transcribe_btn.setEnabled(True)
     
     def play_audio(self):
-        """Play selected audio file"""
+        """Play selected audio file (resumes if paused)"""
         if not self.audio_file or not self.audio_file.exists():
             QMessageBox.warning(self, "Warning", "No audio file to play")
             return
@@ -892,87 +1637,60 @@ class QtTranscribeTab(QWidget):
             return
         
         try:
-            self.is_playing = True
-            self.play_btn.setEnabled(False)
-            self.pause_btn.setEnabled(True)
-            
-            # Play audio in background thread
-            self.playback_thread = threading.Thread(
-                target=self._play_audio_worker,
-                daemon=True
-            )
-            self.playback_thread.start()
+            player = self._ensure_player()
+            if player.state() != QMediaPlayer.PausedState or self._player_file != self.audio_file:
+                player.setMedia(QMediaContent(QUrl.fromLocalFile(str(self.audio_file))))
+                self._player_file = self.audio_file
+            self._total_mmss = f"{int(self.total_duration // 60)}:{int(self.total_duration % 60):02d}"
+            self._last_shown_sec = -1
+            player.play()
         except Exception as e:
             self.is_playing = False
             if DebugConfig.stt_enabled:
                 print(f"[DEBUG] Error starting playback: {e}")
             QMessageBox.critical(self, "Error", f"Failed to play audio: {str(e)}")
     
-    def _play_audio_worker(self):
-        """Worker thread for audio playback - updates seekbar during playback"""
-        try:
-            pygame.mixer.music.load(str(self.audio_file))
-            pygame.mixer.music.play()
-            
-            # Update seekbar position during playback
-            import time
-            while pygame.mixer.music.get_busy():
-                # Get current playback position in milliseconds
-                pos = pygame.mixer.music.get_pos()
-                if pos >= 0:
-                    # Update seekbar and time label
-                    self.seekbar.blockSignals(True)  # Block signals to prevent seek during update
-                    self.seekbar.setValue(pos)
-                    
-                    # Update time label
-                    current_seconds = pos / 1000.0
-                    current_min = int(current_seconds // 60)
-                    current_sec = int(current_seconds % 60)
-                    total_min = int(self.total_duration // 60)
-                    total_sec = int(self.total_duration % 60)
-                    self.time_label.setText(f"{current_min}:{current_sec:02d} / {total_min}:{total_sec:02d}")
-                    
-                    self.seekbar.blockSignals(False)
-                
-                time.sleep(0.1)  # Update 10 times per second
-            
-            # Playback finished
-            self.is_playing = False
-            self.play_btn.setEnabled(True)
-            self.pause_btn.setEnabled(False)
+    def _on_playback_position(self, pos):
+        """Update seekbar and time label from the player position (milliseconds)"""
+        blocker = QSignalBlocker(self.seekbar)  # Prevent seek during update
+        self.seekbar.setValue(pos)
+        blocker.unblock()
+        
+        # The label only shows whole seconds - skip the 9 of 10 updates that wouldn't change it
+        current_seconds = pos // 1000
+        if current_seconds == self._last_shown_sec:
+            return
+        self._last_shown_sec = current_seconds
+        self.time_label.setText(f"{current_seconds // 60}:{current_seconds % 60:02d} / {self._total_mmss}")
+    
+    def _on_playback_state(self, state):
+        """Keep buttons in sync with the player and reset the seekbar when playback stops"""
+        self.is_playing = state == QMediaPlayer.PlayingState
+        self.play_btn.setEnabled(not self.is_playing)
+        self.pause_btn.setEnabled(self.is_playing)
+        if state == QMediaPlayer.StoppedState:
             self.seekbar.setValue(0)
-            self.time_label.setText(f"0:00 / {int(self.total_duration // 60)}:{int(self.total_duration % 60):02d}")
-        except Exception as e:
-            self.is_playing = False
-            if DebugConfig.stt_enabled:
-                print(f"[DEBUG] Playback error: {e}")
+            self._last_shown_sec = -1
+            self.time_label.setText(f"0:00 / {self._total_mmss}")
     
     def pause_audio(self):
         """Pause audio playback"""
-        try:
-            if pygame.mixer.music.get_busy():
-                pygame.mixer.music.pause()
-        except Exception as e:
-            if DebugConfig.stt_enabled:
-                print(f"[DEBUG] Pause error: {e}")
+        if self._player is not None and self._player.state() == QMediaPlayer.PlayingState:
+            self._player.pause()
     
     def stop_audio(self):
         """Stop audio playback"""
-        try:
-            pygame.mixer.music.stop()
-            self.is_playing = False
-            self.play_btn.setEnabled(True)
-            self.pause_btn.setEnabled(False)
-        except Exception as e:
-            if DebugConfig.stt_enabled:
-                print(f"[DEBUG] Stop error: {e}")
+        if self._player is not None:
+            self._player.stop()
+        self.is_playing = False
+        self.play_btn.setEnabled(True)
+        self.pause_btn.setEnabled(False)
     
     def copy_to_clipboard(self):
         """Copy transcribed text to clipboard"""
         text = self.output_text.toPlainText()
         if text:
-            from PyQt5.QtWidgets import QApplication
-            QApplication.clipboard().setText(text)
+            self._clipboard.setText(text)
             QMessageBox.information(self, "Success", "Text copied to clipboard!")
     
     def clear_output(self):
@@ -987,11 +1705,13 @@ class QtTranscribeTab(QWidget):
             return
         
         # Try to send to active chat tab
-        if self.app and hasattr(self.app, 'chat_tabs'):
-            current_tab = self.app.chat_tabs.currentWidget()
-            if current_tab and hasattr(current_tab, 'input_text'):
-                current_tab.input_text.setText(text)
-                self.app.chat_tabs.setCurrentWidget(current_tab)
+        chat_tabs = getattr(self.app, 'chat_tabs', None)
+        if chat_tabs is not None:
+            current_tab = chat_tabs.currentWidget()
+            input_text = getattr(current_tab, 'input_text', None)
+            if input_text is not None:
+                input_text.setText(text)
+                chat_tabs.setCurrentWidget(current_tab)
                 QMessageBox.information(self, "Success", "Text sent to chat input!")
             else:
                 QMessageBox.warning(self, "Warning", "No active chat tab found")
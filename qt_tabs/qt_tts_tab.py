@@ -12,6 +12,8 @@ from PyQt5.QtCore import Qt
 from settings_manager import load_settings
 from settings_saver import get_settings_saver
 from pathlib import Path
+from functools import partial
+from debug_config import DebugConfig
 
 
 class QtTTSTab(QWidget):
@@ -94,7 +96,7 @@ class QtTTSTab(QWidget):
         self.speed_label = QLabel("1.0x")
         self.speed_label.setMinimumWidth(40)
         speed_layout.addWidget(self.speed_label, 0)
-        self.speed_slider.valueChanged.connect(lambda v: self._update_speed_label(v))
+        self.speed_slider.valueChanged.connect(partial(self._update_slider_label, self.speed_label, 10.0, "{:.1f}x"))
         common_layout.addLayout(speed_layout)
         
         # Volume
@@ -108,7 +110,7 @@ class QtTTSTab(QWidget):
         self.volume_label = QLabel("1.0")
         self.volume_label.setMinimumWidth(30)
         volume_layout.addWidget(self.volume_label, 0)
-        self.volume_slider.valueChanged.connect(lambda v: self._update_volume_label(v))
+        self.volume_slider.valueChanged.connect(partial(self._update_slider_label, self.volume_label, 100.0, "{:.1f}"))
         common_layout.addLayout(volume_layout)
         
         python_tts_group.setLayout(common_layout)
@@ -118,23 +120,11 @@ class QtTTSTab(QWidget):
         piper_group = QGroupBox("Piper Settings")
         piper_layout = QVBoxLayout()
         
-        # Piper executable path
-        piper_exe_layout = QHBoxLayout()
-        piper_exe_layout.addWidget(QLabel("Piper Executable:"), 0)
-        self.piper_exe_input = QLineEdit()
-        piper_exe_layout.addWidget(self.piper_exe_input, 1)
-        browse_btn = QPushButton("Browse")
-        browse_btn.setMaximumWidth(80)
-        browse_btn.clicked.connect(self.browse_piper_exe)
-        piper_exe_layout.addWidget(browse_btn, 0)
-        piper_layout.addLayout(piper_exe_layout)
-        
-        # Piper model
-        piper_model_layout = QHBoxLayout()
-        piper_model_layout.addWidget(QLabel("Piper Model:"), 0)
-        self.piper_model_input = QLineEdit()
-        piper_model_layout.addWidget(self.piper_model_input, 1)
-        piper_layout.addLayout(piper_model_layout)
+        # Piper executable path and model
+        self._add_input_rows(piper_layout, [
+            ("Piper Executable:", "piper_exe_input", self.browse_piper_exe),
+            ("Piper Model:", "piper_model_input", None),
+        ])
         
         piper_group.setLayout(piper_layout)
         scroll_layout.addWidget(piper_group)
@@ -143,35 +133,13 @@ class QtTTSTab(QWidget):
         f5_group = QGroupBox("F5-TTS Settings")
         f5_layout = QVBoxLayout()
         
-        # F5-TTS URL
-        f5_url_layout = QHBoxLayout()
-        f5_url_layout.addWidget(QLabel("F5-TTS Server URL:"), 0)
-        self.f5_url_input = QLineEdit()
+        # F5-TTS URL, reference audio and folder
+        self._add_input_rows(f5_layout, [
+            ("F5-TTS Server URL:", "f5_url_input", None),
+            ("Reference Audio:", "ref_audio_input", self.browse_ref_audio),
+            ("F5-TTS Folder:", "f5_folder_input", self.browse_f5_folder),
+        ])
         self.f5_url_input.setText("http://127.0.0.1:7860")
-        f5_url_layout.addWidget(self.f5_url_input, 1)
-        f5_layout.addLayout(f5_url_layout)
-        
-        # Reference audio
-        ref_audio_layout = QHBoxLayout()
-        ref_audio_layout.addWidget(QLabel("Reference Audio:"), 0)
-        self.ref_audio_input = QLineEdit()
-        ref_audio_layout.addWidget(self.ref_audio_input, 1)
-        browse_audio_btn = QPushButton("Browse")
-        browse_audio_btn.setMaximumWidth(80)
-        browse_audio_btn.clicked.connect(self.browse_ref_audio)
-        ref_audio_layout.addWidget(browse_audio_btn, 0)
-        f5_layout.addLayout(ref_audio_layout)
-        
-        # F5-TTS folder
-        folder_layout = QHBoxLayout()
-        folder_layout.addWidget(QLabel("F5-TTS Folder:"), 0)
-        self.f5_folder_input = QLineEdit()
-        folder_layout.addWidget(self.f5_folder_input, 1)
-        browse_folder_btn = QPushButton("Browse")
-        browse_folder_btn.setMaximumWidth(80)
-        browse_folder_btn.clicked.connect(self.browse_f5_folder)
-        folder_layout.addWidget(browse_folder_btn, 0)
-        f5_layout.addLayout(folder_layout)
         
         # Remove silence
         self.remove_silence_checkbox = QCheckBox("Remove silence")
@@ -210,7 +178,7 @@ class QtTTSTab(QWidget):
         self.nfe_label = QLabel("16")
         self.nfe_label.setMinimumWidth(30)
         nfe_layout.addWidget(self.nfe_label, 0)
-        self.nfe_slider.valueChanged.connect(lambda v: self.nfe_label.setText(str(v)))
+        self.nfe_slider.valueChanged.connect(partial(self._update_slider_label, self.nfe_label, 1, "{}"))
         f5_layout.addLayout(nfe_layout)
         
         # Speed slider
@@ -223,7 +191,7 @@ class QtTTSTab(QWidget):
         self.f5_speed_label = QLabel("1.0x")
         self.f5_speed_label.setMinimumWidth(40)
         f5_speed_layout.addWidget(self.f5_speed_label, 0)
-        self.f5_speed_slider.valueChanged.connect(lambda v: self._update_f5_speed_label(v))
+        self.f5_speed_slider.valueChanged.connect(partial(self._update_slider_label, self.f5_speed_label, 10.0, "{:.1f}x"))
         f5_layout.addLayout(f5_speed_layout)
         
         f5_group.setLayout(f5_layout)
@@ -236,20 +204,38 @@ class QtTTSTab(QWidget):
         main_layout.addWidget(scroll)
         self.setLayout(main_layout)
     
-    def _update_speed_label(self, value):
-        """Update speed label"""
-        speed = value / 10.0
-        self.speed_label.setText(f"{speed:.1f}x")
+    def _add_input_rows(self, parent_layout, rows):
+        """Add "label + line edit (+ Browse button)" rows to a layout
+        
+        Args:
+            parent_layout: Layout the rows are added to
+            rows: List of (label text, attribute name for the QLineEdit, browse callback or None)
+        """
+        for label_text, attr, browse_callback in rows:
+            row = QHBoxLayout()
+            row.addWidget(QLabel(label_text), 0)
+            line_edit = QLineEdit()
+            setattr(self, attr, line_edit)
+            row.addWidget(line_edit, 1)
+            if browse_callback:
+                browse_btn = QPushButton("Browse")
+                browse_btn.setMaximumWidth(80)
+                browse_btn.clicked.connect(browse_callback)
+                row.addWidget(browse_btn, 0)
+            parent_layout.addLayout(row)
     
-    def _update_volume_label(self, value):
-        """Update volume label"""
-        vol = value / 100.0
-        self.volume_label.setText(f"{vol:.1f}")
-    
-    def _update_f5_speed_label(self, value):
-        """Update F5 speed label"""
-        speed = value / 10.0
-        self.f5_speed_label.setText(f"{speed:.1f}x")
+    def _update_slider_label(self, label, divisor, fmt, value):
+        """Show a slider's scaled value in its label
+        
+        Args:
+            label: QLabel next to the slider
+            divisor: Slider units per displayed unit (10 for speed, 100 for volume, 1 for NFE)
+            fmt: Format string for the scaled value
+            value: Slider value from valueChanged
+        """
+        text = fmt.format(value / divisor if divisor != 1 else value)
+        if label.text() != text:  # Dragging often lands on values that round to the same text
+            label.setText(text)
     
     def browse_piper_exe(self):
         """Browse for Piper executable"""
@@ -270,14 +256,15 @@ class QtTTSTab(QWidget):
             self.f5_folder_input.setText(folder_path)
     
     def on_tab_changed(self, index):
-        """Called when tab changes - reload settings (TTS is global, not per-server)"""
-        # TTS settings are global now, not per-server
-        self.settings = load_settings()  # Reload settings from disk
+        """Called when tab changes - reload settings when this tab is shown (TTS is global, not per-server)"""
+        # Switching between other tabs doesn't need to touch this tab's widgets
+        if self.parent_app.tabs.widget(index) is not self:
+            return
         self.load_settings_values()
     
     def load_settings_values(self):
         """Load current settings into UI"""
-        # Reload settings from disk to get latest values
+        # Get latest values (load_settings keeps them cached in memory)
         self.settings = load_settings()
         
         # Load engine selection (global, no server prefix)
@@ -312,7 +299,7 @@ class QtTTSTab(QWidget):
     
     def save_tts_settings(self):
         """Save all TTS settings (global, not per-server)"""
-        settings = load_settings()
+        settings = {}
         
         # Save engine selection (global keys, no server prefix)
         engine_id = self.engine_buttons.checkedId()
@@ -324,8 +311,8 @@ class QtTTSTab(QWidget):
             engine_name = "piper"
         settings["tts_engine"] = engine_name
         
-        print(f"[DEBUG] Saving engine_id={engine_id}, engine_name={engine_name}")
-        print(f"[DEBUG] Before save - settings['tts_engine'] = {settings.get('tts_engine')}")
+        if DebugConfig.tts_enabled:
+            print(f"[DEBUG] Saving engine_id={engine_id}, engine_name={engine_name}")
         
         # Save Python TTS settings (global keys)
         settings["tts_voice"] = self.voice_combo.currentText()
@@ -347,26 +334,17 @@ class QtTTSTab(QWidget):
         settings["tts_f5tts_nfe_slider"] = self.nfe_slider.value()
         settings["tts_f5tts_speed_slider"] = self.f5_speed_slider.value() / 10.0
         
+        # Only hand the saver the keys that actually changed
+        current = load_settings()
+        changed = {key: value for key, value in settings.items() if current.get(key) != value}
+        if not changed:
+            if DebugConfig.tts_enabled:
+                print("[DEBUG] TTS settings unchanged - nothing to save")
+            return  # No-op save: don't rewrite the settings file
+        
         saver = get_settings_saver()
-        saver.sync_from_ui_dict(settings)
+        saver.sync_from_ui_dict(changed)
         saver.save()
-        print(f"[DEBUG] ✅ TTS settings saved: {engine_name}")
-        
-        # Verify the save worked
-        verify_settings = load_settings()
-        verify_engine = verify_settings.get("tts_engine", "NOT_FOUND")
-        print(f"[DEBUG] Verification - tts_engine in file: {verify_engine}")
-        if verify_engine != engine_name:
-            print(f"[ERROR] Save failed! Expected {engine_name}, but file has {verify_engine}")
-        else:
-            print(f"[DEBUG] ✅ Verification passed - saved correctly to file")
-        
-        # Extra debug: read and print raw file content
-        try:
-            import json
-            with open("chat_settings.json", "r", encoding="utf-8") as f:
-                raw_content = json.load(f)
-            print(f"[DEBUG] Raw file tts_engine value: {raw_content.get('tts_engine', 'NOT_FOUND')}")
-        except Exception as e:
-            print(f"[DEBUG] Could not read raw file: {e}")
-
+        
+        if DebugConfig.tts_enabled:
+            print(f"[DEBUG] ✅ TTS settings saved: {engine_name} ({len(changed)} changed)")
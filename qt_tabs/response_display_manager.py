@@ -2,14 +2,24 @@
 Response Display Manager - Handles message rendering, token counting, and streaming display
 """
 
+import html
 from datetime import datetime
+from functools import lru_cache
 from PyQt5.QtGui import QTextCursor, QTextCharFormat, QColor
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from settings_manager import load_settings
 from settings_saver import get_settings_saver
-from chat_manager import ChatManager
 from debug_config import DebugConfig
-from response_cleaner import ResponseCleaner
+
+
+@lru_cache(maxsize=512)
+def _iso_to_display(ts):
+    """Parse an ISO timestamp into YYYY-MM-DD HH:MM:SS (None if unparseable) - cached since
+    history timestamps repeat"""
+    try:
+        return datetime.fromisoformat(ts).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
 
 
 class ResponseDisplayManager:
@@ -29,61 +39,106 @@ class ResponseDisplayManager:
         self.memory = chat_tab.memory
         self.message_history = chat_tab.message_history
         
-        # Hash tracking for duplicate prevention
-        self._last_image_trigger_hash = None
+        # Text formats and server label are reused for every message and chunk
+        self._fmt_user = QTextCharFormat()
+        self._fmt_user.setForeground(QColor(0, 102, 204))      # #0066cc
+        self._fmt_server = QTextCharFormat()
+        self._fmt_server.setForeground(QColor(0, 153, 0))      # #009900
+        self._fmt_body = QTextCharFormat()
+        self._fmt_body.setForeground(QColor(51, 51, 51))       # #333333
+        self._server_label = self.server_type.upper() if self.server_type != "llama-server" else "LLAMA"
+        
+        # Response fingerprint tracking for duplicate prevention
+        self._last_image_trigger_fp = None
+        
+        # Optional chat tab collaborators - created after this manager, so resolved on first use
+        self._collaborators_bound = False
         
+        # Streaming state - set up front so the per-chunk path uses plain attribute loads
+        self._streaming_header_added = False
+        self._streaming_start_time = ""
+        self._streaming_word_buffer_parts = []
+        
+        # Streamed words waiting to be inserted - flushed in one batch per frame (~30 Hz)
+        self._pending_display = []
+        self._flush_timer = QTimer(self.message_display)
+        self._flush_timer.setInterval(33)
+        self._flush_timer.setSingleShot(False)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        
+    def _bind_collaborators(self):
+        """Resolve the chat tab's optional managers/widgets once (None when the tab lacks them)"""
+        chat_tab = self.chat_tab
+        self._persistence_manager = getattr(chat_tab, 'persistence_manager', None)
+        self._image_manager = getattr(chat_tab, 'image_manager', None)
+        self._tts_manager = getattr(chat_tab, 'tts_manager', None)
+        self._gen_images_cb = getattr(chat_tab, 'generating_images_checkbox', None)
+        self._tts_cb = getattr(chat_tab, 'tts_enabled_checkbox', None)
+        self._update_border = getattr(chat_tab, 'update_input_border_state', None)
+        self._resume_voice = getattr(chat_tab, 'resume_voice_listening', None)
+        self._collaborators_bound = True
+    
+    def _end_cursor(self):
+        """Cursor placed directly at the end of the document (no movePosition walk)"""
+        doc = self.message_display.document()
+        cursor = QTextCursor(doc)
+        cursor.setPosition(doc.characterCount() - 1)
+        return cursor
+    
+    @staticmethod
+    def _format_timestamp(timestamp):
+        """Use provided timestamp (ISO converted to YYYY-MM-DD HH:MM:SS) or create new one"""
+        if timestamp is None:
+            return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if isinstance(timestamp, str) and "T" in timestamp:
+            # Fast path - "YYYY-MM-DDTHH:MM:SS[.ffffff][+HH:MM]" is just a string reshape
+            if len(timestamp) >= 19 and timestamp[10] == "T":
+                return timestamp[:10] + " " + timestamp[11:19]
+            # Other ISO variants go through the cached parser; unparseable ones fall back to now
+            # (not cached, so the fallback stays current)
+            return _iso_to_display(timestamp) or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return timestamp
+    
     def display_message(self, text, is_user=False, timestamp=None):
         """Display message in chat window with timestamp"""
+        debug = DebugConfig.chat_message_history
         # Skip completely empty messages
         if not text or not str(text).strip():
-            if DebugConfig.chat_message_history:
+            if debug:
                 print(f"[DEBUG-UI] Skipping empty message (is_user={is_user})")
             return
         
-        cursor = self.message_display.textCursor()
-        cursor.movePosition(QTextCursor.End)
+        # Keep ordering - any streamed words still pending go in first
+        self._flush_pending()
         
-        # Use provided timestamp or create new one
-        if timestamp is None:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        elif isinstance(timestamp, str) and "T" in timestamp:
-            # Convert ISO format to YYYY-MM-DD HH:MM:SS
-            try:
-                dt = datetime.fromisoformat(timestamp)
-                timestamp = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        cursor = self._end_cursor()
+        
+        timestamp = self._format_timestamp(timestamp)
         
         if is_user:
             # User message - blue
-            # Add blank line before message (except for first message)
-            if self.message_display.toPlainText():
-                if DebugConfig.chat_message_history:
+            # Add blank line before message (except for first message) - isEmpty() is O(1),
+            # unlike toPlainText() which copies the whole conversation
+            if not self.message_display.document().isEmpty():
+                if debug:
                     print(f"[DEBUG-UI] Adding blank line before user message")
                 cursor.insertText("\n")
             else:
-                if DebugConfig.chat_message_history:
+                if debug:
                     print(f"[DEBUG-UI] First message - no blank line before")
             
-            format_obj = QTextCharFormat()
-            format_obj.setForeground(QColor("#0066cc"))
-            cursor.setCharFormat(format_obj)
+            cursor.setCharFormat(self._fmt_user)
             text_to_add = f"[{timestamp}] You: {text}\n"
-            if DebugConfig.chat_message_history:
+            if debug:
                 print(f"[DEBUG-UI] Adding user message: {repr(text_to_add[:50])}")
             cursor.insertText(text_to_add)
         else:
             # Assistant message - using server type instead of "Assistant"
-            server_label = self.server_type.upper() if self.server_type != "llama-server" else "LLAMA"
-            format_obj = QTextCharFormat()
-            format_obj.setForeground(QColor("#009900"))
-            cursor.setCharFormat(format_obj)
-            cursor.insertText(f"[{timestamp}] {server_label}: ")
+            cursor.setCharFormat(self._fmt_server)
+            cursor.insertText(f"[{timestamp}] {self._server_label}: ")
             
             # Reset format for message text
-            format_obj = QTextCharFormat()
-            format_obj.setForeground(QColor("#333333"))
-            cursor.setCharFormat(format_obj)
+            cursor.setCharFormat(self._fmt_body)
             cursor.insertText(f"{text}\n")
         
         self.message_display.setTextCursor(cursor)
@@ -92,63 +147,64 @@ class ResponseDisplayManager:
     def on_message_chunk(self, chunk):
         """Handle incoming message chunk from streaming response - display word-by-word"""
         # On first chunk, add the server label + timestamp header if not already done
-        if not getattr(self, '_streaming_header_added', False):
+        if not self._streaming_header_added:
             self._streaming_header_added = True
             self._streaming_start_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self._streaming_word_buffer = ""
-            
-            cursor = self.message_display.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            
-            # Add server label with timestamp
-            server_label = self.server_type.upper() if self.server_type != "llama-server" else "LLAMA"
-            format_obj = QTextCharFormat()
-            format_obj.setForeground(QColor("#009900"))
-            cursor.setCharFormat(format_obj)
-            cursor.insertText(f"[{self._streaming_start_time}] {server_label}: ")
-            
-            # Reset format for message text (will be black/default)
-            format_obj = QTextCharFormat()
-            format_obj.setForeground(QColor("#333333"))
-            cursor.setCharFormat(format_obj)
+            self._streaming_word_buffer_parts = []
             
+            # Add server label with timestamp - one cursor copy; the body text that follows
+            # is inserted by _flush_pending with its own format
+            cursor = self._end_cursor()
+            cursor.insertText(f"[{self._streaming_start_time}] {self._server_label}: ", self._fmt_server)
+            cursor.setCharFormat(self._fmt_body)
             self.message_display.setTextCursor(cursor)
         
-        # Buffer characters until we have a complete word
-        self._streaming_word_buffer += chunk
+        # Buffer chunks until we have a complete word (joined only when one completes,
+        # so long runs without whitespace don't re-copy the buffer on every chunk)
+        parts = self._streaming_word_buffer_parts
+        parts.append(chunk)
         
-        # Process complete words (separated by spaces or newlines)
+        # Process complete words (separated by spaces or newlines) - everything up to
+        # and including the last whitespace is displayable, the partial word after it waits
         words_to_display = ""
-        remaining_buffer = ""
-        
-        for i, char in enumerate(self._streaming_word_buffer):
-            if char in (" ", "\n", "\t"):
-                # Found a word boundary - include the whitespace
-                words_to_display += self._streaming_word_buffer[:i+1]
-                remaining_buffer = self._streaming_word_buffer[i+1:]
-                break
-        else:
-            # No word boundary found yet, keep buffering
-            remaining_buffer = self._streaming_word_buffer
-            words_to_display = ""
+        if " " in chunk or "\n" in chunk or "\t" in chunk:
+            buf = "".join(parts)
+            cut = max(buf.rfind(" "), buf.rfind("\n"), buf.rfind("\t"))
+            words_to_display = buf[:cut+1]
+            remaining = buf[cut+1:]
+            parts[:] = [remaining] if remaining else []
         
-        # Display complete words
+        # Queue complete words - the flush timer inserts them in one batch per frame
         if words_to_display:
-            cursor = self.message_display.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            format_obj = QTextCharFormat()
-            format_obj.setForeground(QColor("#333333"))
-            cursor.setCharFormat(format_obj)
-            cursor.insertText(words_to_display)
-            self.message_display.setTextCursor(cursor)
+            self._pending_display.append(words_to_display)
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+    
+    def _flush_pending(self):
+        """Insert all queued streamed words with a single cursor edit and scroll"""
+        if not self._pending_display:
+            self._flush_timer.stop()
+            return
         
-        # Keep remaining characters in buffer for next chunk
-        self._streaming_word_buffer = remaining_buffer
+        text = "".join(self._pending_display)
+        self._pending_display.clear()
+        
+        # Only follow the stream if the user hasn't scrolled up to read earlier text
+        bar = self.message_display.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum() - 4
+        
+        self.message_display.setUpdatesEnabled(False)
+        try:
+            cursor = self._end_cursor()
+            cursor.setCharFormat(self._fmt_body)
+            cursor.insertText(text)
+            self.message_display.setTextCursor(cursor)
+        finally:
+            self.message_display.setUpdatesEnabled(True)
         
-        # Auto-scroll to bottom to see latest word
-        self.message_display.verticalScrollBar().setValue(
-            self.message_display.verticalScrollBar().maximum()
-        )
+        # Auto-scroll to bottom to see latest words
+        if at_bottom:
+            bar.setValue(bar.maximum())
     
     def on_token_info(self, prompt_tokens, generated_tokens):
         """Handle token count information from worker thread"""
@@ -157,21 +213,23 @@ class ResponseDisplayManager:
     
     def on_message_received(self, response):
         """Handle received message"""
-        if DebugConfig.chat_enabled:
+        # Read the debug flag once per response (still follows runtime toggles from the debug tab)
+        debug = DebugConfig.chat_enabled
+        if not self._collaborators_bound:
+            self._bind_collaborators()
+        if debug:
             print(f"[DEBUG-RESPONSE] on_message_received() CALLED with response: {response[:60]}...")
         
-        # Clean response to remove hallucinated conversation exchanges
-        cleaned_response = ResponseCleaner.clean_response(response)
-        if cleaned_response != response:
-            if DebugConfig.chat_enabled:
-                print(f"[DEBUG-RESPONSE] Response cleaned - before: {len(response)} chars, after: {len(cleaned_response)} chars")
+        # ChatWorkerThread already ran ResponseCleaner.clean_response() on its own thread
+        # before emitting, so don't block the UI thread cleaning it a second time
+        cleaned_response = response
         
         # Store response and timestamp for later use in on_response_generated
         self._last_response = cleaned_response
         self._last_response_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # If streaming was used, use the streaming start time instead
-        if hasattr(self, '_streaming_header_added') and self._streaming_header_added:
+        if self._streaming_header_added:
             self._last_response_timestamp = self._streaming_start_time
         
         # If streaming was used, response was already displayed chunk-by-chunk
@@ -179,149 +237,159 @@ class ResponseDisplayManager:
         
         timestamp = self._last_response_timestamp
         
-        if hasattr(self, '_streaming_header_added') and self._streaming_header_added:
+        if self._streaming_header_added:
             # Streaming was used - response already displayed
             # Use the streaming start time (when first chunk arrived) for consistency
             
-            # Display any remaining buffered word fragments
-            if hasattr(self, '_streaming_word_buffer') and self._streaming_word_buffer:
-                cursor = self.message_display.textCursor()
-                cursor.movePosition(QTextCursor.End)
-                format_obj = QTextCharFormat()
-                format_obj.setForeground(QColor("#333333"))
-                cursor.setCharFormat(format_obj)
-                cursor.insertText(self._streaming_word_buffer)
-                self.message_display.setTextCursor(cursor)
-                self._streaming_word_buffer = ""
-            
-            # Add newline at the end of the streamed response
-            cursor = self.message_display.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            cursor.insertText("\n")
-            self.message_display.setTextCursor(cursor)
+            # Queue any remaining buffered word fragments plus the closing newline and
+            # insert them together with the queued words in one cursor edit
+            self._pending_display.extend(self._streaming_word_buffer_parts)
+            self._pending_display.append("\n")
+            self._streaming_word_buffer_parts = []
+            self._flush_pending()
+            self._flush_timer.stop()
             # Reset streaming flag for next message
             self._streaming_header_added = False
         else:
             # Non-streaming mode - display full response
             self.display_message(cleaned_response, is_user=False, timestamp=timestamp)
         
+        # Disk save, image extraction and TTS init are queued for the next event-loop
+        # tick so the text is painted before any of them start
+        
         # Trigger persistence manager to save
-        if hasattr(self.chat_tab, 'persistence_manager'):
-            self.chat_tab.persistence_manager.save_message_history()
+        if self._persistence_manager is not None:
+            QTimer.singleShot(0, self._persistence_manager.save_message_history)
         
         # Guard against multiple image generation triggers for the same response
-        # Store the response hash to detect if we're being called again with the same response
-        response_hash = hash(cleaned_response[:100]) if cleaned_response else 0
-        if not hasattr(self, '_last_image_trigger_hash') or self._last_image_trigger_hash != response_hash:
-            self._last_image_trigger_hash = response_hash
+        # Store a (length, prefix) fingerprint to detect if we're being called again with the
+        # same response - the tuple compare short-circuits on the length before the string
+        response_fp = (len(cleaned_response), cleaned_response[:32]) if cleaned_response else None
+        if self._last_image_trigger_fp != response_fp:
+            self._last_image_trigger_fp = response_fp
             
             # Check if we should trigger image generation
-            if hasattr(self.chat_tab, 'generating_images_checkbox') and self.chat_tab.generating_images_checkbox.isChecked():
-                if hasattr(self.chat_tab, 'image_manager'):
-                    if DebugConfig.chat_enabled:
-                        print(f"[DEBUG] Triggering image generation (hash={response_hash})")
-                    self.chat_tab.image_manager.trigger_image_generation_if_needed(cleaned_response, timestamp)
+            if self._gen_images_cb is not None and self._gen_images_cb.isChecked():
+                if self._image_manager is not None:
+                    if debug:
+                        print(f"[DEBUG] Triggering image generation (fingerprint={response_fp})")
+                    image_manager = self._image_manager
+                    QTimer.singleShot(0, lambda: image_manager.trigger_image_generation_if_needed(cleaned_response, timestamp))
         else:
-            if DebugConfig.chat_enabled:
-                print(f"[DEBUG] Skipping image generation - same response hash ({response_hash})")
+            if debug:
+                print(f"[DEBUG] Skipping image generation - same response fingerprint ({response_fp})")
         
         # Check if we should speak the response
-        if DebugConfig.chat_enabled:
-            print(f"[DEBUG] ResponseDisplay: Checking TTS - has tts_enabled_checkbox={hasattr(self.chat_tab, 'tts_enabled_checkbox')}, has tts_manager={hasattr(self.chat_tab, 'tts_manager')}")
-        if hasattr(self.chat_tab, 'tts_enabled_checkbox') and self.chat_tab.tts_enabled_checkbox.isChecked():
-            if DebugConfig.chat_enabled:
+        if debug:
+            print(f"[DEBUG] ResponseDisplay: Checking TTS - has tts_enabled_checkbox={self._tts_cb is not None}, has tts_manager={self._tts_manager is not None}")
+        if self._tts_cb is not None and self._tts_cb.isChecked():
+            if debug:
                 print(f"[DEBUG] ResponseDisplay: TTS checkbox is CHECKED")
-            if hasattr(self.chat_tab, 'tts_manager'):
-                if DebugConfig.chat_enabled:
+            if self._tts_manager is not None:
+                if debug:
                     print(f"[DEBUG] ResponseDisplay: Calling tts_manager.speak_response()")
-                self.chat_tab.tts_manager.speak_response(cleaned_response, timestamp)
+                tts_manager = self._tts_manager
+                QTimer.singleShot(0, lambda: tts_manager.speak_response(cleaned_response, timestamp))
             else:
-                if DebugConfig.chat_enabled:
+                if debug:
                     print(f"[DEBUG] ResponseDisplay: ERROR - tts_manager not found!")
         else:
-            if DebugConfig.chat_enabled:
+            if debug:
                 print(f"[DEBUG] ResponseDisplay: TTS checkbox NOT checked or attribute missing")
         
         # Show bright green border to signal ready for input
-        if hasattr(self.chat_tab, 'update_input_border_state'):
-            self.chat_tab.update_input_border_state(bright=True)
+        if self._update_border is not None:
+            self._update_border(bright=True)
     
     def on_error(self, error_msg):
         """Handle error from worker thread"""
         self.display_message(f"[ERROR] {error_msg}", is_user=False)
-        self.chat_tab.send_button.setEnabled(True)
-        self.chat_tab.progress_bar.setMinimumHeight(0)  # Hide with zero height
-        self.chat_tab.progress_bar.setMaximumHeight(0)
-        self.chat_tab.progress_bar.setVisible(False)
-        self.chat_tab.is_generating = False
-        
-        # Resume voice listening if it was paused
-        if self.chat_tab.voice_input_paused and hasattr(self.chat_tab, 'resume_voice_listening'):
-            print("[VOICE_INPUT] LLM error - resuming listening")
-            self.chat_tab.resume_voice_listening()
-        
-        # Update status panel
-        if hasattr(self.app, 'status_panel'):
-            self.app.status_panel.set_llm_status('idle')
-        
-        # Update input border - show ready for input
-        if hasattr(self.chat_tab, 'update_input_border_state'):
-            self.chat_tab.update_input_border_state(bright=True)
+        self._reset_generation_ui("[VOICE_INPUT] LLM error - resuming listening")
     
     def on_generation_finished(self):
         """Handle generation finished"""
-        self.chat_tab.is_generating = False
-        self.chat_tab.send_button.setEnabled(True)
         self.chat_tab.stop_button.setEnabled(False)
-        self.chat_tab.progress_bar.setMinimumHeight(0)  # Hide with zero height
-        self.chat_tab.progress_bar.setMaximumHeight(0)
-        self.chat_tab.progress_bar.setVisible(False)
+        self._reset_generation_ui("[VOICE_INPUT] ✅ LLM response complete - resuming listening")
+    
+    def _reset_generation_ui(self, resume_message):
+        """
+        Return the chat tab to its idle state after a generation ends
+        
+        Args:
+            resume_message: Console line printed when paused voice listening is resumed
+        """
+        chat_tab = self.chat_tab
+        if not self._collaborators_bound:
+            self._bind_collaborators()
+        chat_tab.is_generating = False
+        
+        # Group the widget changes so Qt relayouts once
+        chat_tab.setUpdatesEnabled(False)
+        try:
+            chat_tab.send_button.setEnabled(True)
+            chat_tab.progress_bar.setVisible(False)
+            chat_tab.progress_bar.setFixedHeight(0)  # Hide with zero height (min + max in one call)
+            
+            # Update input border - show ready for input
+            if self._update_border is not None:
+                self._update_border(bright=True)
+        finally:
+            chat_tab.setUpdatesEnabled(True)
         
         # Resume voice listening if it was paused
-        if self.chat_tab.voice_input_paused and hasattr(self.chat_tab, 'resume_voice_listening'):
-            print("[VOICE_INPUT] ✅ LLM response complete - resuming listening")
-            self.chat_tab.resume_voice_listening()
+        if chat_tab.voice_input_paused and self._resume_voice is not None:
+            print(resume_message)
+            self._resume_voice()
         else:
             if DebugConfig.chat_memory_operations:
-                print(f"[VOICE_INPUT] Response finished but voice not paused (paused={self.chat_tab.voice_input_paused})")
+                print(f"[VOICE_INPUT] Generation ended but voice not paused (paused={chat_tab.voice_input_paused})")
         
         # Update status panel
         if hasattr(self.app, 'status_panel'):
             self.app.status_panel.set_llm_status('idle')
-        
-        # Update input border - show ready for input
-        if hasattr(self.chat_tab, 'update_input_border_state'):
-            self.chat_tab.update_input_border_state(bright=True)
     
-    def load_message_history(self):
-        """Load chat history from ChatManager"""
-        try:
-            chat_manager = ChatManager(self.server_type)
-            messages = chat_manager.load_chat(self.chat_tab.current_chat_name)
-            
-            self.message_history.clear()
+    def display_history(self, messages):
+        """
+        Show a whole stored conversation with a single document edit
+        
+        Renders every message into one HTML string (same layout and colors as
+        display_message()) and sets it in one call instead of one cursor edit per message.
+        
+        Args:
+            messages: List of message dicts with 'role', 'content', 'timestamp'
+        """
+        user_color = self._fmt_user.foreground().color().name()
+        server_color = self._fmt_server.foreground().color().name()
+        body_color = self._fmt_body.foreground().color().name()
+        label = html.escape(self._server_label)
+        
+        def to_html(text):
+            return html.escape(text).replace("\n", "<br>")
+        
+        parts = []
+        for msg in messages:
+            text = msg.get("content", "")
+            if not text or not str(text).strip():
+                continue
+            timestamp = html.escape(str(self._format_timestamp(msg.get("timestamp"))))
+            if msg.get("role") == "user":
+                if parts:
+                    parts.append("<br>")
+                parts.append(f'<span style="color:{user_color}">[{timestamp}] You: {to_html(str(text))}</span><br>')
+            else:
+                parts.append(f'<span style="color:{server_color}">[{timestamp}] {label}: </span>')
+                parts.append(f'<span style="color:{body_color}">{to_html(str(text))}</span><br>')
+        
+        if not parts:
             self.message_display.clear()
-            
-            # Display all messages
-            for msg in messages:
-                self.display_message(
-                    msg.get("content", ""),
-                    is_user=msg.get("role") == "user",
-                    timestamp=msg.get("timestamp")
-                )
-                self.message_history.append(msg)
-            
-            if DebugConfig.chat_message_history:
-                print(f"[DEBUG] Loaded {len(messages)} messages from {self.chat_tab.current_chat_name}.json")
-        except Exception as e:
-            print(f"Error loading message history: {e}")
-    
-    def save_message_history(self):
-        """Save message history to ChatManager"""
+            return
+        
+        self.message_display.setUpdatesEnabled(False)
         try:
-            chat_manager = ChatManager(self.server_type)
-            chat_manager.save_chat(self.chat_tab.current_chat_name, self.message_history)
-            if DebugConfig.chat_message_history:
-                print(f"[DEBUG] Saved {len(self.message_history)} messages to {self.chat_tab.current_chat_name}.json")
-        except Exception as e:
-            print(f"Error saving history: {e}")
+            self.message_display.setHtml(
+                '<div style="white-space:pre-wrap">' + "".join(parts) + "</div>"
+            )
+        finally:
+            self.message_display.setUpdatesEnabled(True)
+        self.message_display.setTextCursor(self._end_cursor())
+        self.message_display.ensureCursorVisible()
@@ -2,15 +2,20 @@
 Server Connection Manager - Handles server connectivity, model management, and template selection
 """
 
-import threading
+import re
+import weakref
 from datetime import datetime
-from PyQt5.QtCore import Qt, pyqtSignal, QObject
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer, QSignalBlocker
 from PyQt5.QtWidgets import QMessageBox
 from settings_manager import load_settings, get_setting, set_setting
 from settings_saver import get_settings_saver
 from chat_template_manager import template_manager
 from debug_config import DebugConfig
 
+# Embedding / reranker model names (case-insensitive) - excluded from the chat model list.
+# "embed" also covers "embedding" and "nomic-embed".
+_EMBED_RE = re.compile(r'embed|rerank|bge-|all-minilm', re.IGNORECASE)
+
 
 class ConnectionSignals(QObject):
     """Qt signals for thread-safe connection updates"""
@@ -20,15 +25,40 @@ class ConnectionSignals(QObject):
     models_load_failed = pyqtSignal(str)  # Emits error message
 
 
+class _ConnTestRunnable(QRunnable):
+    """Runs a manager's connection test on the shared thread pool"""
+    
+    def __init__(self, manager):
+        super().__init__()
+        # Weak reference so a queued test doesn't keep a closed tab's manager alive
+        self._manager_ref = weakref.ref(manager)
+    
+    def run(self):
+        manager = self._manager_ref()
+        if manager is not None:
+            manager._test_connection()
+
+
+class _LoadModelsRunnable(QRunnable):
+    """Fetches a manager's model list on the shared thread pool"""
+    
+    def __init__(self, manager):
+        super().__init__()
+        self._manager_ref = weakref.ref(manager)
+    
+    def run(self):
+        manager = self._manager_ref()
+        if manager is not None:
+            manager._load_models()
+
+
 class ServerConnectionManager:
     """Manages server connection, model loading, and template selection"""
     
     @staticmethod
     def _is_chat_model(model_name):
         """Check if model is a chat model (exclude embedding and other non-chat models)"""
-        embedding_keywords = ['embed', 'embedding', 'rerank', 'bge-', 'all-minilm', 'nomic-embed']
-        model_lower = model_name.lower()
-        return not any(keyword in model_lower for keyword in embedding_keywords)
+        return _EMBED_RE.search(model_name) is None
     
     def __init__(self, chat_tab):
         """
@@ -47,18 +77,35 @@ class ServerConnectionManager:
         self.app = chat_tab.app
         self.settings = load_settings()
         
+        # server_type never changes for a manager - derive the settings prefix and status
+        # panel labels once
+        server_type_lower = (self.server_type or "").lower()
+        if "ollama" in server_type_lower:
+            self._tab_prefix = "ollama_"
+        elif "llama" in server_type_lower:
+            self._tab_prefix = "llama-server_"
+        else:
+            self._tab_prefix = ""
+        server_name = "Ollama" if self.server_type == "ollama" else "Llama-Server"
+        self._server_display_connected = f"{server_name} Connected"
+        self._server_display_offline = f"{server_name} Offline"
+        
         # Template combo is now in the settings tab
         self.template_combo = None
         try:
-            # Try to find the settings tab in the app's main tab widget
-            if hasattr(self.app, 'tabs') and hasattr(self.app.tabs, 'widget'):
+            # Find the settings tab once per app and remember it for every later manager
+            settings_tab = getattr(self.app, '_cached_settings_tab', None)
+            if settings_tab is None and hasattr(self.app, 'tabs') and hasattr(self.app.tabs, 'widget'):
+                # Try to find the settings tab in the app's main tab widget
                 for i in range(self.app.tabs.count()):
                     widget = self.app.tabs.widget(i)
                     if hasattr(widget, 'template_combo'):
-                        self.template_combo = widget.template_combo
+                        settings_tab = widget
+                        self.app._cached_settings_tab = widget
                         if DebugConfig.chat_template_formatting:
                             print(f"[DEBUG-TEMPLATE] Found template_combo in settings tab")
                         break
+            self.template_combo = getattr(settings_tab, 'template_combo', None)
         except Exception as e:
             if DebugConfig.chat_template_formatting:
                 print(f"[DEBUG-TEMPLATE] Error finding template combo: {e}")
@@ -66,6 +113,18 @@ class ServerConnectionManager:
         # Track the current model selection during this session (for reconnects)
         self._current_model_selection = None
         
+        # Parent widget with currentWidget() (the tab stack) - resolved on first use because the
+        # chat tab isn't parented yet while its managers are being built
+        self._tab_widget = None
+        
+        # Model selection is saved 300 ms after the last change so scrolling through the
+        # combo writes settings once, not once per step
+        self._pending_model = None
+        self._save_timer = QTimer(chat_tab)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(self._flush_model_save)
+        
         # Create PER-INSTANCE signal object (prevents broadcast to other managers)
         self.signals = ConnectionSignals()
         
@@ -80,33 +139,32 @@ class ServerConnectionManager:
         self.connect_button.setText("Connecting...")
         self.connect_button.setEnabled(False)
         
-        thread = threading.Thread(target=self._test_connection)
-        thread.daemon = True
-        thread.start()
+        QThreadPool.globalInstance().start(_ConnTestRunnable(self))
     
     def _test_connection(self):
         """Test connection in background thread - uses signals to update UI safely"""
         try:
-            print(f"[DEBUG-CONNECTION] Starting connection test in background thread...")
+            if DebugConfig.connection_requests:
+                print(f"[DEBUG-CONNECTION] Starting connection test in background thread...")
             if self.client.test_connection():
-                print(f"[DEBUG-CONNECTION] Connection test succeeded, emitting signal")
+                if DebugConfig.connection_requests:
+                    print(f"[DEBUG-CONNECTION] Connection test succeeded, emitting signal")
                 self.signals.connection_succeeded.emit()
             else:
-                print(f"[DEBUG-CONNECTION] Connection test failed")
+                if DebugConfig.connection_requests:
+                    print(f"[DEBUG-CONNECTION] Connection test failed")
                 self.signals.connection_failed.emit("Connection failed")
         except Exception as e:
             print(f"[DEBUG-CONNECTION] Connection test exception: {e}")
             import traceback
             traceback.print_exc()
             self.signals.connection_failed.emit(str(e))
-        finally:
-            # Re-enable button in main thread via signal
-            self.connect_button.setText("Connect")
-            self.connect_button.setEnabled(True)
     
     def _on_connection_succeeded(self):
         """Handle successful connection (called from main thread via signal)"""
-        print(f"[DEBUG-CONNECTION] {self.server_type.upper()} Connection succeeded signal received, updating UI")
+        if DebugConfig.connection_requests:
+            print(f"[DEBUG-CONNECTION] {self.server_type.upper()} Connection succeeded signal received, updating UI")
+        self._reset_connect_button()
         self.update_connection_status(connected=True)
         # Store current selection before refresh (only for Ollama, not Llama-Server)
         if self.model_combo is not None:
@@ -116,14 +174,26 @@ class ServerConnectionManager:
     
     def _on_connection_failed(self, error_msg):
         """Handle failed connection (called from main thread via signal)"""
-        print(f"[DEBUG-CONNECTION] {self.server_type.upper()} Connection failed signal received: {error_msg}")
+        if DebugConfig.connection_requests:
+            print(f"[DEBUG-CONNECTION] {self.server_type.upper()} Connection failed signal received: {error_msg}")
+        self._reset_connect_button()
         self.update_connection_status(connected=False, error=error_msg)
     
+    def _reset_connect_button(self):
+        """Re-enable the Connect button once the test has reported back"""
+        self.connect_button.setText("Connect")
+        self.connect_button.setEnabled(True)
+    
     def _is_current_tab(self):
         """Check if this tab is the currently active tab in the tab widget"""
         try:
+            tab_widget = self._tab_widget
+            if tab_widget is not None and tab_widget.currentWidget() is self.chat_tab:
+                return True
+            # Not cached yet, or a miss - re-resolve the parent in case the tab was reparented
             parent = self.chat_tab.parent()
-            if parent and hasattr(parent, 'currentWidget'):
+            if parent is not None and hasattr(parent, 'currentWidget'):
+                self._tab_widget = parent
                 return parent.currentWidget() is self.chat_tab
         except:
             pass
@@ -138,13 +208,8 @@ class ServerConnectionManager:
             self.status_label.setStyleSheet("color: #00aa00; font-weight: bold;")
             
             # Update global status panel with this server's connection
-            if self.server_type == "ollama":
-                server_display = "Ollama Connected"
-            else:  # llama-server
-                server_display = "Llama-Server Connected"
-            
             if hasattr(self.app, 'status_panel'):
-                self.app.status_panel.set_connection_status(True, server_display, server_type=self.server_type)
+                self.app.status_panel.set_connection_status(True, self._server_display_connected, server_type=self.server_type)
             
             # Show initial prompt so user knows to type
             if hasattr(self.chat_tab, 'response_manager'):
@@ -161,11 +226,7 @@ class ServerConnectionManager:
             
             # Update status panel - show offline for this server
             if hasattr(self.app, 'status_panel'):
-                if self.server_type == "ollama":
-                    server_display = "Ollama Offline"
-                else:
-                    server_display = "Llama-Server Offline"
-                self.app.status_panel.set_connection_status(False, server_display, server_type=self.server_type)
+                self.app.status_panel.set_connection_status(False, self._server_display_offline, server_type=self.server_type)
         
         # Update input border based on connection state
         if hasattr(self.chat_tab, 'update_input_border_state'):
@@ -173,17 +234,17 @@ class ServerConnectionManager:
     
     def refresh_models(self):
         """Refresh list of available models"""
-        thread = threading.Thread(target=self._load_models)
-        thread.daemon = True
-        thread.start()
+        QThreadPool.globalInstance().start(_LoadModelsRunnable(self))
     
     def _load_models(self):
         """Load models from server in background thread - uses signals to update UI safely"""
         try:
-            print(f"[DEBUG-MODELS] Loading models from server...")
+            if DebugConfig.chat_enabled:
+                print(f"[DEBUG-MODELS] Loading models from server...")
             models = self.client.get_available_models()
             if models:
-                print(f"[DEBUG-MODELS] Loaded {len(models)} models, emitting signal")
+                if DebugConfig.chat_enabled:
+                    print(f"[DEBUG-MODELS] Loaded {len(models)} models, emitting signal")
                 self.signals.models_loaded.emit(models)
             else:
                 self.signals.models_load_failed.emit("No models available")
@@ -193,13 +254,14 @@ class ServerConnectionManager:
     
     def _on_models_loaded(self, models):
         """Handle models loaded - called from main thread via signal"""
-        print(f"[DEBUG-MODELS] Models loaded signal received, updating UI with {len(models)} models")
         if DebugConfig.chat_enabled:
+            print(f"[DEBUG-MODELS] Models loaded signal received, updating UI with {len(models)} models")
             print(f"[DEBUG-MODELS] Full model list from server: {models}")
         try:
             # Skip if no model combo (Llama-Server doesn't have one)
             if self.model_combo is None:
-                print(f"[DEBUG-MODELS] Skipping model loading - Llama-Server doesn't support model selection")
+                if DebugConfig.chat_enabled:
+                    print(f"[DEBUG-MODELS] Skipping model loading - Llama-Server doesn't support model selection")
                 return
             
             # Remember the currently selected model
@@ -208,35 +270,33 @@ class ServerConnectionManager:
                 current_selection = None
             
             # Block signals while populating combo to prevent triggering on_model_selected for each item
-            self.model_combo.blockSignals(True)
-            try:
+            with QSignalBlocker(self.model_combo):
                 self.model_combo.clear()
                 # Filter out embedding and non-chat models
-                chat_models = [m for m in models if self._is_chat_model(m)]
+                search = _EMBED_RE.search
+                chat_models = [m for m in models if search(m) is None]
                 if DebugConfig.chat_enabled:
                     print(f"[DEBUG-MODELS] After filtering: {len(chat_models)} chat models: {chat_models}")
-                for model in chat_models:
-                    self.model_combo.addItem(model)
+                self.model_combo.addItems(chat_models)
                 
-                # SIMPLE LOGIC: Just restore if the model is actually in the list
-                from settings_manager import load_settings
-                current_settings = load_settings()
-                tab_prefix = ""
-                if "ollama" in self.server_type.lower():
-                    tab_prefix = "ollama_"
-                elif "llama" in self.server_type.lower():
-                    tab_prefix = "llama-server_"
+                # SIMPLE LOGIC: Just restore if the model is actually in the list.
+                # A selection still waiting on the debounce timer is newer than the stored
+                # setting - write it now so the combo and settings agree
+                self._save_timer.stop()
+                self._flush_model_save()
+                saved_model = get_setting(f"{self._tab_prefix}server_model", None)
                 
-                saved_model = current_settings.get(f"{tab_prefix}server_model", None)
-                
-                # Only restore if the saved model is ACTUALLY in the current list
-                if saved_model and saved_model in chat_models:
-                    index = self.model_combo.findText(saved_model)
-                    if index >= 0:
-                        self.model_combo.setCurrentIndex(index)
-                        self._current_model_selection = saved_model
-                        if DebugConfig.chat_enabled:
-                            print(f"[DEBUG-MODELS] ✓ Restored saved model (found in list): {saved_model}")
+                # Only restore if the saved model is ACTUALLY in the current list - the combo was
+                # filled from chat_models, so the list position is the combo index
+                try:
+                    saved_index = chat_models.index(saved_model) if saved_model else -1
+                except ValueError:
+                    saved_index = -1
+                if saved_index >= 0:
+                    self.model_combo.setCurrentIndex(saved_index)
+                    self._current_model_selection = saved_model
+                    if DebugConfig.chat_enabled:
+                        print(f"[DEBUG-MODELS] ✓ Restored saved model (found in list): {saved_model}")
                 elif chat_models:
                     # Default to first model
                     self.model_combo.setCurrentIndex(0)
@@ -247,18 +307,9 @@ class ServerConnectionManager:
                     else:
                         if DebugConfig.chat_enabled:
                             print(f"[DEBUG-MODELS] No saved model, using first: {chat_models[0]}")
-            finally:
-                # Re-enable signals after restoration
-                self.model_combo.blockSignals(False)
             
-            # Update status panel with server type (only if this tab is active)
-            if self._is_current_tab():
-                if self.server_type == "ollama":
-                    server_display = "Ollama Connected"
-                else:  # llama-server
-                    server_display = "Llama-Server Connected"
-                if hasattr(self.app, 'status_panel'):
-                    self.app.status_panel.set_connection_status(True, server_display, server_type=self.server_type)
+            # Status panel was already set to connected by update_connection_status() before this
+            # refresh started, and tab switches update it from the chat tab - nothing to redo here
         except Exception as e:
             print(f"[DEBUG-MODELS] Error in _on_models_loaded: {e}")
     
@@ -272,27 +323,25 @@ class ServerConnectionManager:
             # Template combo was removed from UI, skip
             return
         
-        self.template_combo.blockSignals(True)
-        self.template_combo.clear()
-        
-        # Add all available templates
-        for template_name in template_manager.get_available_templates():
-            self.template_combo.addItem(template_name)
-        
-        # Restore saved selection or default to "auto"
-        saved_template = get_setting("chat_template_selection", "auto")
-        index = self.template_combo.findText(saved_template)
-        if index >= 0:
-            self.template_combo.setCurrentIndex(index)
-            if DebugConfig.chat_template_formatting:
-                print(f"[DEBUG-TEMPLATE] Restored template: {saved_template}")
-        else:
-            # Default to "auto"
-            self.template_combo.setCurrentIndex(0)
-            if DebugConfig.chat_template_formatting:
-                print(f"[DEBUG-TEMPLATE] No saved template, defaulting to: auto")
-        
-        self.template_combo.blockSignals(False)
+        # Signals stay blocked until the with-block exits, even if populating raises
+        with QSignalBlocker(self.template_combo):
+            self.template_combo.clear()
+            
+            # Add all available templates
+            self.template_combo.addItems(list(template_manager.get_available_templates()))
+            
+            # Restore saved selection or default to "auto"
+            saved_template = get_setting("chat_template_selection", "auto")
+            index = self.template_combo.findText(saved_template)
+            if index >= 0:
+                self.template_combo.setCurrentIndex(index)
+                if DebugConfig.chat_template_formatting:
+                    print(f"[DEBUG-TEMPLATE] Restored template: {saved_template}")
+            else:
+                # Default to "auto"
+                self.template_combo.setCurrentIndex(0)
+                if DebugConfig.chat_template_formatting:
+                    print(f"[DEBUG-TEMPLATE] No saved template, defaulting to: auto")
     
     def on_model_selected(self, model_name):
         """Handle model selection change"""
@@ -305,25 +354,22 @@ class ServerConnectionManager:
         
         # Update status panel with server type (only if this tab is active)
         if self._is_current_tab():
-            if self.server_type == "ollama":
-                server_display = "Ollama Connected"
-            else:  # llama-server
-                server_display = "Llama-Server Connected"
             if hasattr(self.app, 'status_panel'):
-                self.app.status_panel.set_connection_status(True, server_display, server_type=self.server_type)
-        
-        # Determine the tab prefix for settings
-        tab_prefix = ""
-        if "ollama" in self.server_type.lower():
-            tab_prefix = "ollama_"
-        elif "llama" in self.server_type.lower():
-            tab_prefix = "llama-server_"
+                self.app.status_panel.set_connection_status(True, self._server_display_connected, server_type=self.server_type)
         
-        # Track model selection in settings - save immediately
-        from settings_manager import set_setting
-        set_setting(f"{tab_prefix}server_model", model_name)
+        # Track model selection in settings - (re)start the debounce timer
+        self._pending_model = model_name
+        self._save_timer.start()
+    
+    def _flush_model_save(self):
+        """Save the last selected model once the selection has settled"""
+        model_name = self._pending_model
+        if model_name is None:
+            return
+        self._pending_model = None
+        set_setting(f"{self._tab_prefix}server_model", model_name)
         if DebugConfig.chat_enabled:
-            print(f"[DEBUG] Model saved immediately: {model_name}")
+            print(f"[DEBUG] Model saved: {model_name}")
     
     def on_template_selected(self, template_name):
         """Handle template selection change"""
@@ -331,11 +377,14 @@ class ServerConnectionManager:
             # Template combo was removed from UI, skip
             return
         
-        print(f"[DEBUG] on_template_selected() called with: {template_name}")
+        if DebugConfig.chat_template_formatting:
+            print(f"[DEBUG] on_template_selected() called with: {template_name}")
         if template_name and not template_name.startswith("("):
-            print(f"[DEBUG] Saving template: {template_name}")
+            if DebugConfig.chat_template_formatting:
+                print(f"[DEBUG] Saving template: {template_name}")
             set_setting("chat_template_selection", template_name)
             if DebugConfig.chat_template_formatting:
                 print(f"[DEBUG-TEMPLATE] Selected and saved template: {template_name}")
         else:
-            print(f"[DEBUG] Skipping template save - placeholder or empty")
+            if DebugConfig.chat_template_formatting:
+                print(f"[DEBUG] Skipping template save - placeholder or empty")
@@ -8,10 +8,61 @@ Generates natural language context for LLM awareness of:
 - Time gap since last message
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from debug_config import DebugConfig
 
 
+# Day of week names indexed by datetime.weekday() (0=Monday, 6=Sunday)
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Month names indexed by month - 1
+_MONTH_NAMES = ("January", "February", "March", "April", "May", "June", "July",
+                "August", "September", "October", "November", "December")
+
+# Time of day indexed by hour (Morning 5-11, Afternoon 12-16, Evening 17-20, Night otherwise)
+_HOUR_TO_TOD = tuple(
+    "Morning" if 5 <= hour < 12 else
+    "Afternoon" if 12 <= hour < 17 else
+    "Evening" if 17 <= hour < 21 else
+    "Night"
+    for hour in range(24)
+)
+
+# Fixed-date holidays keyed by (month, day)
+_HOLIDAYS = {
+    (1, 1): "Happy New Year!",
+    (2, 14): "It's Valentine's Day",
+    (3, 17): "It's St. Patrick's Day",
+    (4, 22): "It's Earth Day",
+    (7, 4): "It's Independence Day (USA)",
+    (10, 31): "It's Halloween",
+    (11, 11): "It's Veterans Day",
+    (12, 25): "Merry Christmas!",
+    (12, 31): "It's New Year's Eve",
+}
+
+# Last generated context, keyed by its 5-minute time bucket (the output's own resolution)
+_CTX_CACHE = {"key": None, "value": ""}
+
+
+@lru_cache(maxsize=8)
+def _thanksgiving_and_black_friday(year):
+    """
+    Day of month of Thanksgiving (4th Thursday of November) and Black Friday for a year.
+    
+    Args:
+        year: Calendar year
+    
+    Returns:
+        tuple: (thanksgiving_day, black_friday_day)
+    """
+    first_day = datetime(year, 11, 1)
+    first_thursday = first_day + timedelta(days=(3 - first_day.weekday()) % 7)
+    fourth_thursday = first_thursday + timedelta(weeks=3)
+    return fourth_thursday.day, (fourth_thursday + timedelta(days=1)).day
+
+
 class TimeAwareContext:
     """Generate time-aware context for LLM conversations"""
     
@@ -19,7 +70,8 @@ class TimeAwareContext:
     def get_context(message_history):
         """
         Generate comprehensive time-aware context for LLM.
-        IMPORTANT: Generates FRESH context every time - no caching!
+        IMPORTANT: Always reflects the CURRENT time - the result is only reused within the
+        same 5-minute bucket, which the output rounds to anyway, so it is never stale.
         
         Args:
             message_history: List of message dicts with 'role', 'content', 'timestamp'
@@ -29,8 +81,6 @@ class TimeAwareContext:
             Only includes TIME, not date - avoids stale cached values!
         """
         try:
-            context_parts = []
-            
             # Always use CURRENT time (not from old messages)
             current_ts = datetime.now()
             current_hour = current_ts.hour
@@ -38,39 +88,28 @@ class TimeAwareContext:
             current_day = current_ts.day
             current_month = current_ts.month
             
+            # Same date, hour and 5-minute bucket -> identical text, reuse it
+            key = (current_ts.year, current_month, current_day, current_hour, current_minute // 5)
+            if key == _CTX_CACHE["key"]:
+                return _CTX_CACHE["value"]
+            
             if DebugConfig.connection_requests:
                 print(f"[DEBUG-TIME] TimeAwareContext: Current time = {current_ts}")
             
             # Get day of week (0=Monday, 6=Sunday)
-            day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-            day_of_week = day_names[current_ts.weekday()]
+            day_of_week = _DAY_NAMES[current_ts.weekday()]
             
             # Get month name
-            month_names = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]
-            month_name = month_names[current_month - 1]
+            month_name = _MONTH_NAMES[current_month - 1]
             
             # Determine time of day
-            if 5 <= current_hour < 12:
-                time_of_day = "Morning"
-            elif 12 <= current_hour < 17:
-                time_of_day = "Afternoon"
-            elif 17 <= current_hour < 21:
-                time_of_day = "Evening"
-            else:
-                time_of_day = "Night"
+            time_of_day = _HOUR_TO_TOD[current_hour]
             
             # Format time naturally (rounded to nearest 5 minutes)
             rounded_minute = (current_minute // 5) * 5
-            if rounded_minute == 0:
-                natural_time = f"{current_hour:02d}:{rounded_minute:02d}"
-            else:
-                natural_time = f"{current_hour:02d}:{rounded_minute:02d}"
-            
-            # Build context string with FULL date info: time, date, month, year, day of week
-            context_parts.append(f"{natural_time} on {day_of_week}, {month_name} {current_day}, {current_ts.year}")
-            context_parts.append(f"It's {time_of_day.lower()}")
+            natural_time = f"{current_hour:02d}:{rounded_minute:02d}"
             
-            # Add month phase context
+            # Month phase context
             if current_day <= 10:
                 month_phase = "beginning of the month"
             elif current_day >= 20:
@@ -78,13 +117,19 @@ class TimeAwareContext:
             else:
                 month_phase = "middle of the month"
             
-            context_parts.append(f"This is the {month_phase}")
+            # Build context string with FULL date info: time, date, month, year, day of week
+            context = (
+                f"{natural_time} on {day_of_week}, {month_name} {current_day}, {current_ts.year}. "
+                f"It's {time_of_day.lower()}. This is the {month_phase}."
+            )
             
             # Add time gap from last message if available
             # (Disabled - causes issues with cached system prompts in multi-turn conversations)
             # Just return the basic time context
             
-            return ". ".join(context_parts) + "."
+            _CTX_CACHE["key"] = key
+            _CTX_CACHE["value"] = context
+            return context
         except Exception as e:
             if DebugConfig.chat_enabled:
                 print(f"[DEBUG] Error generating time context: {e}")
@@ -102,40 +147,17 @@ class TimeAwareContext:
         Returns:
             str: Holiday context string or empty string
         """
-        holidays = {
-            (1, 1): "Happy New Year!",
-            (2, 14): "It's Valentine's Day",
-            (3, 17): "It's St. Patrick's Day",
-            (4, 22): "It's Earth Day",
-            (7, 4): "It's Independence Day (USA)",
-            (10, 31): "It's Halloween",
-            (11, 11): "It's Veterans Day",
-            (12, 25): "Merry Christmas!",
-            (12, 31): "It's New Year's Eve",
-        }
-        
         # Check for exact match
-        if (month, day) in holidays:
-            return holidays[(month, day)]
+        holiday = _HOLIDAYS.get((month, day))
+        if holiday:
+            return holiday
         
-        # Check for Thanksgiving (4th Thursday of November)
+        # Check for Thanksgiving (4th Thursday of November) and Black Friday (day after, USA)
         if month == 11:
-            # Calculate 4th Thursday
-            first_day = datetime(datetime.now().year, 11, 1)
-            from datetime import timedelta
-            first_thursday = first_day + timedelta(days=(3 - first_day.weekday()))
-            fourth_thursday = first_thursday + timedelta(weeks=3)
-            if day == fourth_thursday.day:
+            thanksgiving, black_friday = _thanksgiving_and_black_friday(datetime.now().year)
+            if day == thanksgiving:
                 return "It's Thanksgiving"
-        
-        # Check for Black Friday (day after Thanksgiving in USA)
-        if month == 11:
-            first_day = datetime(datetime.now().year, 11, 1)
-            from datetime import timedelta
-            first_thursday = first_day + timedelta(days=(3 - first_day.weekday()))
-            fourth_thursday = first_thursday + timedelta(weeks=3)
-            black_friday = fourth_thursday + timedelta(days=1)
-            if day == black_friday.day:
+            if day == black_friday:
                 return "It's Black Friday"
         
         # Check for Easter (approximate - varies each year)